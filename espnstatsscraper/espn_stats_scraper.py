@@ -1,17 +1,23 @@
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import random
 import json
 import re
 import asyncio
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterator
 import argparse
 import os
+import sys
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 import unicodedata
+import gzip
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 try:
     from playwright.async_api import async_playwright
@@ -21,107 +27,381 @@ except ImportError:
     print("Warning: Playwright not installed. Browser automation will not be available.")
     print("Install with: pip install playwright && playwright install chromium")
 
+# Optional on-disk HTTP cache, so re-runs don't re-download pages
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional zstd compression for the JSONL outputs (gzip is used without it)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Optional faster JSON encoder for the JSONL outputs and progress files
+try:
+    import orjson
+
+    def _to_jsonl(obj) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+
+    def _to_json(obj, compact=False) -> bytes:
+        return orjson.dumps(obj) if compact else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _to_jsonl(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _to_json(obj, compact=False) -> bytes:
+        if compact:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_json_atomic(path: str, obj, compact=False):
+    """Write to a temp file and rename over path, so an interrupted save never leaves a truncated file"""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_to_json(obj, compact))
+    os.replace(tmp, path)
+
+# Free-threaded CPython (3.13t+, or PYTHON_GIL=0): worker threads can parse pages in parallel too
+GIL_DISABLED = hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled()
+
 MONTHS = {
     "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
     "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
 }
 
+_DIGITS = frozenset('0123456789')
+
+# Patterns used on every page / row, compiled once
+_RE_COMPETITOR = re.compile(r'(MMACompetitor|Competitor)')
+_RE_COMPETITOR_CLASS = re.compile(r'(?:^| )(?:MMA)?Competitor(?: |$)')
+_RE_FIGHTCARD = re.compile(r'(MMAFightCard|MMAFightCard__Gamestrip|Gamestrip)')
+_RE_CARD_HEADER_TITLE = re.compile(r'Card__Header__Title')
+_RE_HEADING = re.compile(r'^h[1-6]$')
+_RE_ID = re.compile(r'/id/(\d+)')
+_RE_NONALPHA = re.compile(r'[^a-z]')
+_RE_SCHED_DATE = re.compile(r'([A-Za-z]{3})\s+(\d{1,2})')
+_RE_FIGHTER_HREF = re.compile(r'/mma/fighter/_/id/')
+_RE_FIGHTER_URL = re.compile(r'/mma/fighter/_/id/(\d+)(?:/([^/?#]+))?')
+_RE_LEAGUE = re.compile(r'/league/([a-z0-9-]+)')
+_RE_ESPN_SUFFIX = re.compile(r'\s*-\s*ESPN.*$')
+_RE_FIGHT_RESULTS = re.compile(r'\s*Fight Results\s*$')
+_RE_FIGHTER_ID = re.compile(r'~a:(\d+)')
+_RE_TITLE_NAME = re.compile(r'^([^(]+)')
+_RE_DIB_UNIFORM = re.compile(r'dib flex-uniform')
+_RE_HT_WT = re.compile(r"([^,]+),\s*(.+)")
+_RE_BIRTHDATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_RE_AGE = re.compile(r'\((\d+)\)')
+_RE_DATE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+_RE_STAT_SLASH = re.compile(r'^\d+/\d+$')
+
+# Bio__Label substrings, checked in order -> bio_data key; '_' keys need their own parsing
+_BIO_LABEL_MAP = (
+    ('country', 'country'),
+    ('wt class', 'weight_class'), ('weight class', 'weight_class'),
+    ('ht/wt', '_hw'), ('height', '_hw'),
+    ('birthdate', '_birth'),
+    ('team', 'team'),
+    ('nickname', 'nickname'),
+    ('stance', 'stance'),
+    ('reach', '_reach'),
+)
+
+# Fight History columns kept in the output, and the ones whose cell links to a fighter/event page
+_ALLOWED_HIST_KEYS = frozenset({'date', 'opponent', 'result', 'method', 'round', 'time', 'event'})
+_LINKED_HIST_KEYS = frozenset({'opponent', 'event'})
+
+# Per-fight identifying fields in Striking/Clinch/Ground tables; every other column is a metric
+_STATS_META_KEYS = ("date", "opponent", "opponent_url", "opponent_id", "event_url", "event_id", "result")
+_STATS_META_KEYSET = frozenset(_STATS_META_KEYS)
+
+# Browser mode only needs the DOM: don't download these
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+_BLOCKED_HOSTS = ("doubleclick", "google-analytics", "adsystem", "segment.io")
+
+# Fight-card expansion, done in-page: click each visible caret still showing the down arrow
+_EXPAND_CARETS_JS = """() => {
+    let n = 0;
+    document.querySelectorAll('[data-testid="gameStripBarCaret"]').forEach(c => {
+        if (c.offsetParent !== null && c.querySelector('svg[data-icon="playerControls-downCarot"]')) {
+            c.click();
+            n++;
+        }
+    });
+    return n;
+}"""
+_CARETS_EXPANDED_JS = """() => ![...document.querySelectorAll('[data-testid="gameStripBarCaret"]')].some(
+    c => c.offsetParent !== null && c.querySelector('svg[data-icon="playerControls-downCarot"]')
+)"""
+
+# True once two polls in a row see the same (non-zero) number of profile links
+_PROFILE_LINKS_STABLE_JS = """() => {
+    const n = document.querySelectorAll('a.MMAFightCenter__ProfileLink').length;
+    const stable = n === window.__espnProfileLinks;
+    window.__espnProfileLinks = n;
+    return stable && n > 0;
+}"""
+
+# Run in the page before page.content() so the HTML handed to BeautifulSoup is smaller
+_STRIP_NON_CONTENT_JS = "() => document.querySelectorAll('script, style, noscript').forEach(el => el.remove())"
+
+# Schedule pages are only read for their tables
+_SCHEDULE_STRAINER = SoupStrainer('table')
+
+# Where a fighter's display name lives inside a competitor / bout container
+_NAME_SELECTORS = (
+    '.MMACompetitor__Name', '.Competitor__Name',
+    '.MMACompetitor__Detail h2', '.Competitor__Detail h2',
+    'h2', 'h3', 'span'
+)
+_CARD_NAME_SELECTORS = (
+    '.MMACompetitor__Name', '.Competitor__Name',
+    '.MMACompetitor__Detail h2', '.Competitor__Detail h2',
+    'h2', 'h3', '.name', '.player__name'
+)
+
+# Fighter profile links plus data-player-uid carriers, gathered in one walk of an event page
+_FIGHTER_SOURCES_SELECTOR = 'a[href*="/mma/fighter/_/id/"], [data-player-uid]'
+
+# Fighter names listed on an event card
+_EVENT_NAME_SELECTOR = ', '.join([
+    '.MMACompetitor__Detail h2',
+    '.Competitor__Detail h2',
+    '.Fighter__Name',
+    '.player__name',
+    '[data-player-uid] h2',
+    '[data-player-uid] .name',
+])
+
+# _normalize_header: drop every ASCII char except a-z in one C-level pass
+_HEADER_TRANS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not ('a' <= chr(c) <= 'z')))
+
+# Normalized header tokens -> canonical Fight History keys
+_HEADER_CANONICAL = {
+    'date': 'date',
+    'opponent': 'opponent',
+    'res': 'result',
+    'result': 'result',
+    'decision': 'method',   # ESPN often labels the method column as "Decision"
+    'method': 'method',
+    'rnd': 'round',
+    'round': 'round',
+    'time': 'time',
+    'event': 'event',
+}
+
+
+# Pure string helpers: the same fighter names/URLs recur across every table on a page
+@lru_cache(maxsize=4096)
+def _strip_accents(s: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+
+
+@lru_cache(maxsize=8192)
+def _clean_text(text: str) -> str:
+    # str.split() with no args collapses the same (unicode) whitespace as \s+, in C
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=8192)
+def _last_name(n: str) -> str:
+    parts = _strip_accents(n).lower().split()
+    return parts[-1] if parts else ""
+
+
+def _is_fighting_style_th(tag) -> bool:
+    """The 'Fighting Style' header cell of a profile-page table.Table"""
+    if tag.name != 'th' or tag.get_text(strip=True) != 'Fighting Style':
+        return False
+    table = tag.find_parent('table')
+    return table is not None and 'Table' in (table.get('class') or ()) and tag.find_parent('thead') is not None
+
+
+@lru_cache(maxsize=256)
+def _bio_label_key(label: str) -> Optional[str]:
+    """Lower-cased Bio__Label text -> bio_data key (or a '_' special case), first match wins"""
+    for needle, key in _BIO_LABEL_MAP:
+        if needle in label:
+            return key
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_fighter_url(url: str) -> Tuple[Optional[str], bool]:
+    """'.../mma/fighter/_/id/123/jon-jones' -> ('123', True); ID-only URLs -> ('123', False)."""
+    m = _RE_FIGHTER_URL.search(url)
+    return (m.group(1), bool(m.group(2))) if m else (None, False)
+
+
+@lru_cache(maxsize=4096)
+def _slug_to_name(href: str) -> str:
+    """Fallback: derive 'robert-whittaker' -> 'Robert Whittaker' from URL."""
+    if not href:
+        return ""
+    parts = href.rstrip('/').split('/')
+    try:
+        i = parts.index('id')
+        if i + 2 < len(parts):
+            slug = parts[i + 2]
+            if slug and slug != '':  # avoid ID-only URLs ending with 'id/<num>/'
+                words = slug.replace('-', ' ').split()
+                return ' '.join(w.capitalize() for w in words)
+    except ValueError:
+        pass
+    return ""
+
 class ESPNMMAScraper:
-    def __init__(self, delay_range=(1, 3), use_browser=False, out_dir="espn_out", allowed_leagues=("ufc",)):
+    # Rewrite progress.json after this many logged completions (it is also written at the end of a run)
+    PROGRESS_COMPACT_EVERY = 50
+    # ...but not more often than this many seconds (a cached or concurrent run completes fighters in bursts)
+    PROGRESS_COMPACT_MIN_INTERVAL = 60.0
+    # Fetch attempts per page in retry_failed_items (normal crawls use max_retries), and the backoff cap
+    RETRY_PASS_MAX_RETRIES = 5
+    MAX_BACKOFF = 30.0
+
+    def __init__(self, delay_range=(1, 3), use_browser=False, out_dir="espn_out", allowed_leagues=("ufc",), max_workers=1, debug=False,
+                 http_cache=False, max_retries=3, compress_output=False):
         """
-        ESPN MMA scraper with optional browser automation
+        ESPN MMA scraper with optional browser automation.
+        max_workers > 1 fetches that many pages concurrently (each still waits its polite delay).
+        debug=True prints the browser-mode page inspection (extra round-trips per event).
+        http_cache=True keeps successful responses in out_dir/http_cache.sqlite for 7 days (needs requests-cache).
+        max_retries is the number of attempts per page fetch (exponential backoff with jitter between them).
+        compress_output=True writes events/fighters as .jsonl.zst (or .jsonl.gz without zstandard).
         """
         self.base_url = "https://www.espn.com"
+        self._base_prefix = self.base_url.rstrip('/')
         self.delay_range = delay_range
+        self.max_workers = max(1, int(max_workers or 1))
+        self.max_retries = max(1, int(max_retries or 1))
+        self.debug = debug
         self.use_browser = use_browser and PLAYWRIGHT_AVAILABLE
         self.out_dir = out_dir
         self.allowed_leagues = {l.lower() for l in (allowed_leagues or [])}
+        self.compress_output = compress_output
         
         # Always create requests session - needed even in browser mode for schedule scraping
-        self.session = requests.Session()
+        self.http_cache = http_cache and REQUESTS_CACHE_AVAILABLE
+        if self.http_cache:
+            os.makedirs(out_dir, exist_ok=True)
+            # Only 200s are stored, so 429/5xx responses are always fetched again
+            self.session = requests_cache.CachedSession(
+                os.path.join(out_dir, "http_cache.sqlite"),
+                backend='sqlite',
+                expire_after=timedelta(days=7),
+                allowable_codes=(200,),
+                cache_control=True,
+            )
+        else:
+            self.session = requests.Session()
+        # Everything goes to www.espn.com, so keep a sized pool of kept-alive
+        # connections instead of re-handshaking TLS; retries are handled in _get_page
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0, pool_block=False)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
         })
         
+        # Per-host request pacing (see _polite_delay)
+        self._rate_lock = threading.Lock()
+        self._host_next_slot: Dict[str, float] = {}
+        
+        # Playwright state, started lazily by the first browser-mode event
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        
         # Setup logging and progress tracking
         self._setup_logging()
         self._setup_progress_tracking()
             
         if use_browser and not PLAYWRIGHT_AVAILABLE:
             print("Warning: Browser automation requested but Playwright not available. Falling back to requests.")
+        if http_cache and not REQUESTS_CACHE_AVAILABLE:
+            print("Warning: HTTP cache requested but requests-cache not installed (pip install requests-cache). Caching disabled.")
 
     def _strip_accents(self, s: str) -> str:
-        return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+        return _strip_accents(s)
     
     def _header_map(self, table) -> Dict[str, int]:
         """Lower-cased header text -> column index."""
-        headers = [self._clean_text(th.get_text()).lower() for th in table.select("thead th")]
-        return {h: i for i, h in enumerate(headers)}
+        thead = table.find("thead")
+        if not thead:
+            return {}
+        return {self._clean_text(th.get_text()).lower(): i for i, th in enumerate(thead.find_all("th"))}
 
 
-    def _names_match_fotn(self, names: List[str], fotn_text: str) -> bool:
-        """Heuristic: consider a match if both fighter last names are present in fotn_text."""
-        if not fotn_text or len(names) != 2:
-            return False
-        def last_name(n: str) -> str:
-            parts = self._strip_accents(n).lower().split()
-            return parts[-1] if parts else ""
-        ln1, ln2 = last_name(names[0]), last_name(names[1])
-        ftxt = self._strip_accents(fotn_text).lower()
-        return (ln1 and ln1 in ftxt) and (ln2 and ln2 in ftxt)
+    def _tag_fotn(self, card_segments: Dict[str, List[Dict[str, Any]]], fotn_text: str):
+        """
+        Set is_fotn on every fight with exactly two fighters whose last names (accent-stripped,
+        lower-cased) both appear in fotn_text.
+        """
+        ftxt = _strip_accents(fotn_text).lower()  # normalized once per event, not once per fight
+        for fights in card_segments.values():
+            for f in fights:
+                names = f.get('fighter_names') or []
+                if len(names) != 2:
+                    continue
+                ln1, ln2 = _last_name(names[0]), _last_name(names[1])
+                if ln1 and ln2 and ln1 in ftxt and ln2 in ftxt:
+                    f['is_fotn'] = True
     
     def _slug_to_name(self, href: str) -> str:
         """Fallback: derive 'robert-whittaker' -> 'Robert Whittaker' from URL."""
-        if not href:
-            return ""
-        parts = href.rstrip('/').split('/')
-        try:
-            i = parts.index('id')
-            if i + 2 < len(parts):
-                slug = parts[i + 2]
-                if slug and slug != '':  # avoid ID-only URLs ending with 'id/<num>/'
-                    words = slug.replace('-', ' ').split()
-                    return ' '.join(w.capitalize() for w in words)
-        except ValueError:
-            pass
-        return ""
+        return _slug_to_name(href)
     
     
 
-    def _extract_name_near_anchor(self, a) -> str:
+    def _name_in_container(self, container, selectors, cache: Optional[Dict[int, str]] = None) -> str:
+        """
+        First usable name text under container for the given selectors ("" if none).
+        With a cache dict, each container is only searched once per page.
+        """
+        key = id(container)
+        if cache is not None and key in cache:
+            return cache[key]
+        name = ""
+        for sel in selectors:
+            el = container.select_one(sel)
+            if el:
+                txt = self._clean_text(el.get_text())
+                if txt and txt.lower() not in ('full profile', 'profile'):
+                    name = txt
+                    break
+        if cache is not None:
+            cache[key] = name
+        return name
+
+    def _extract_name_near_anchor(self, a, name_cache: Optional[Dict[int, str]] = None) -> str:
         """
         Given a fighter <a>, find the human-readable name in nearby containers.
         ESPN often places the text in sibling/ancestor nodes, not inside <a>.
+        Pass the same name_cache for every anchor on a page to resolve each container once.
         """
         if not a:
             return ""
         # 1) Search up to the nearest competitor container, then look for name nodes
-        container = a.find_parent(class_=re.compile(r'(MMACompetitor|Competitor)'))
+        container = a.find_parent(class_=_RE_COMPETITOR)
         if container:
-            for sel in [
-                '.MMACompetitor__Name', '.Competitor__Name',
-                '.MMACompetitor__Detail h2', '.Competitor__Detail h2',
-                'h2', 'h3', 'span'
-            ]:
-                el = container.select_one(sel)
-                if el:
-                    txt = self._clean_text(el.get_text())
-                    if txt and txt.lower() not in ('full profile', 'profile'):
-                        return txt
+            txt = self._name_in_container(container, _NAME_SELECTORS, name_cache)
+            if txt:
+                return txt
 
         # 2) Try close siblings under the same card node
-        card = a.find_parent(class_=re.compile(r'(MMAFightCard|MMAFightCard__Gamestrip|Gamestrip)'))
+        card = a.find_parent(class_=_RE_FIGHTCARD)
         if card:
-            for sel in [
-                '.MMACompetitor__Name', '.Competitor__Name',
-                '.MMACompetitor__Detail h2', '.Competitor__Detail h2',
-                'h2', 'h3', 'span'
-            ]:
-                el = card.select_one(sel)
-                if el:
-                    txt = self._clean_text(el.get_text())
-                    if txt and txt.lower() not in ('full profile', 'profile'):
-                        return txt
+            txt = self._name_in_container(card, _NAME_SELECTORS, name_cache)
+            if txt:
+                return txt
 
         # 3) Last resort: the anchor’s own text
         link_txt = self._clean_text(a.get_text())
@@ -136,12 +416,13 @@ class ESPNMMAScraper:
         using nearby text or falling back to the URL slug.
         """
         mapping: Dict[str, str] = {}
-        for a in soup.select('a[href*="/mma/fighter/_/id/"]'):
+        name_cache: Dict[int, str] = {}
+        for a in soup.find_all('a', href=_RE_FIGHTER_HREF):
             href = a.get('href', '')
             fid = self._extract_id_from_url(href)
             if not fid or fid in mapping:
                 continue
-            name = self._extract_name_near_anchor(a)
+            name = self._extract_name_near_anchor(a, name_cache)
             if not name:
                 name = self._slug_to_name(href)
             if name:
@@ -174,18 +455,36 @@ class ESPNMMAScraper:
         self.logger.addHandler(console_handler)
         
         self.logger.info("ESPN MMA Scraper initialized")
+        if self.max_workers > 1:
+            self.logger.info(f"{self.max_workers} workers ({'free-threaded' if GIL_DISABLED else 'GIL'} Python)")
     
     def _setup_progress_tracking(self):
         """Setup progress tracking files"""
         self.progress_file = os.path.join(self.out_dir, "progress.json")
         self.failed_events_file = os.path.join(self.out_dir, "failed_events.json")
         self.failed_fighters_file = os.path.join(self.out_dir, "failed_fighters.json")
+        # Append-only log of completions since the last full progress.json write
+        self.progress_log_file = os.path.join(self.out_dir, "progress.log.jsonl")
+        self._progress_log = None
+        self._progress_log_pending = 0
+        self._last_progress_save = time.monotonic()
         
         # Load existing progress
         self.completed_events = self._load_progress_file(self.progress_file, "completed_events", set)
         self.completed_fighters = self._load_progress_file(self.progress_file, "completed_fighters", set)
         self.failed_events = self._load_progress_file(self.failed_events_file, "events", list)
+        # url -> its entry in failed_events, so lookups don't scan the list
+        self._failed_event_index: Dict[str, Dict] = {}
+        for entry in self.failed_events:
+            self._failed_event_index.setdefault(entry.get("url"), entry)
         self.failed_fighters = self._load_progress_file(self.failed_fighters_file, "fighters", list)
+        self._failed_fighter_index: Dict[str, Dict] = {}
+        for entry in self.failed_fighters:
+            self._failed_fighter_index.setdefault(entry.get("url"), entry)
+        self._replay_progress_log()
+        # The same fighter can be linked by an ID-only URL on one card and a name-slug URL on another
+        self.completed_fighter_ids = {self._extract_id_from_url(u) for u in self.completed_fighters}
+        self.completed_fighter_ids.discard("")
         
         self.logger.info(f"Loaded progress: {len(self.completed_events)} events, {len(self.completed_fighters)} fighters completed")
         self.logger.info(f"Failed attempts: {len(self.failed_events)} events, {len(self.failed_fighters)} fighters")
@@ -205,69 +504,149 @@ class ESPNMMAScraper:
         
         return data_type()
     
+    def _replay_progress_log(self):
+        """Merge completions and failures appended since the last compaction into the in-memory state"""
+        if not os.path.exists(self.progress_log_file):
+            return
+        try:
+            with open(self.progress_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from an interrupted run
+                    if 'event' in entry:
+                        self.completed_events.add(entry['event'])
+                    elif 'fighter' in entry:
+                        self.completed_fighters.add(entry['fighter'])
+                    elif 'failed_event' in entry:
+                        self._apply_failure("event", entry['failed_event'], entry.get('error', ''), entry.get('timestamp', ''))
+                    elif 'failed_fighter' in entry:
+                        self._apply_failure("fighter", entry['failed_fighter'], entry.get('error', ''), entry.get('timestamp', ''))
+                    elif 'resolved_event' in entry:
+                        self._resolve_failure("event", entry['resolved_event'])
+                    elif 'resolved_fighter' in entry:
+                        self._resolve_failure("fighter", entry['resolved_fighter'])
+        except Exception as e:
+            self.logger.warning(f"Could not replay {self.progress_log_file}: {e}")
+    
+    def _append_progress_log(self, entry: Dict):
+        """Append one line to the progress log (line-buffered, so it survives a hard kill)"""
+        try:
+            if self._progress_log is None:
+                self._progress_log = open(self.progress_log_file, 'a', encoding='utf-8', buffering=1)
+            self._progress_log.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            self.logger.error(f"Failed to append progress: {e}")
+    
+    def _log_completion(self, kind: str, url: str):
+        """
+        Append one completion to the progress log; compact into progress.json every
+        PROGRESS_COMPACT_EVERY completions, at most once per PROGRESS_COMPACT_MIN_INTERVAL seconds
+        """
+        self._append_progress_log({kind: url})
+        self._progress_log_pending += 1
+        if (self._progress_log_pending >= self.PROGRESS_COMPACT_EVERY
+                and time.monotonic() - self._last_progress_save >= self.PROGRESS_COMPACT_MIN_INTERVAL):
+            self._save_progress()
+    
+    def _mark_event_completed(self, event_url: str):
+        self.completed_events.add(event_url)
+        self._log_completion("event", event_url)
+    
+    def _mark_fighter_completed(self, fighter_url: str):
+        self.completed_fighters.add(fighter_url)
+        fighter_id = self._extract_id_from_url(fighter_url)
+        if fighter_id:
+            self.completed_fighter_ids.add(fighter_id)
+        self._log_completion("fighter", fighter_url)
+    
+    def _fighter_completed(self, fighter_url: str) -> bool:
+        """True if this fighter was already scraped, under this URL or another one with the same ID"""
+        return fighter_url in self.completed_fighters or self._extract_id_from_url(fighter_url) in self.completed_fighter_ids
+    
     def _save_progress(self):
-        """Save current progress to files"""
+        """Save current progress to files (and compact the append-only progress log)"""
         try:
             progress_data = {
                 "completed_events": list(self.completed_events),
                 "completed_fighters": list(self.completed_fighters),
                 "last_updated": datetime.now().isoformat()
             }
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress_data, f, indent=2)
+            # Compact: this is the file that grows with the crawl (one URL per completed event/fighter)
+            _write_json_atomic(self.progress_file, progress_data, compact=True)
             
-            if self.failed_events:
-                with open(self.failed_events_file, 'w') as f:
-                    json.dump({"events": self.failed_events}, f, indent=2)
+            # Failures too, before the log that also holds them is removed
+            # (rewritten when emptied too, or retried items would come back from the old file)
+            if self.failed_events or os.path.exists(self.failed_events_file):
+                _write_json_atomic(self.failed_events_file, {"events": self.failed_events})
             
-            if self.failed_fighters:
-                with open(self.failed_fighters_file, 'w') as f:
-                    json.dump({"fighters": self.failed_fighters}, f, indent=2)
+            if self.failed_fighters or os.path.exists(self.failed_fighters_file):
+                _write_json_atomic(self.failed_fighters_file, {"fighters": self.failed_fighters})
+            
+            # Everything in the log is now in progress.json and the failed_* files
+            if self._progress_log is not None:
+                self._progress_log.close()
+                self._progress_log = None
+            if os.path.exists(self.progress_log_file):
+                os.remove(self.progress_log_file)
+            self._progress_log_pending = 0
+            self._last_progress_save = time.monotonic()
                     
         except Exception as e:
             self.logger.error(f"Failed to save progress: {e}")
     
-    def _add_failed_event(self, event_url: str, error: str):
-        """Track failed event for later retry"""
+    def _apply_failure(self, kind: str, url: str, error: str, timestamp: str) -> Dict:
+        """Add url to failed_events/failed_fighters (kind 'event'/'fighter'), or bump its attempts"""
+        entries = getattr(self, f"failed_{kind}s")
+        index = getattr(self, f"_failed_{kind}_index")
+        existing = index.get(url)
+        if existing is not None:
+            existing["attempts"] = existing.get("attempts", 0) + 1
+            existing["last_error"] = error
+            existing["last_attempt"] = timestamp
+            return existing
+        
         failed_entry = {
-            "url": event_url,
-            "error": str(error),
-            "timestamp": datetime.now().isoformat(),
+            "url": url,
+            "error": error,
+            "timestamp": timestamp,
             "attempts": 1
         }
-        
-        # Check if this event already failed before
-        for i, existing in enumerate(self.failed_events):
-            if existing.get("url") == event_url:
-                existing["attempts"] += 1
-                existing["last_error"] = str(error)
-                existing["last_attempt"] = datetime.now().isoformat()
-                self.logger.warning(f"Event failed again (attempt {existing['attempts']}): {event_url}")
-                return
-        
-        self.failed_events.append(failed_entry)
-        self.logger.error(f"Event failed: {event_url} - {error}")
+        entries.append(failed_entry)
+        index[url] = failed_entry
+        return failed_entry
+    
+    def _resolve_failure(self, kind: str, url: str):
+        """Drop url from failed_events/failed_fighters after a successful retry"""
+        setattr(self, f"failed_{kind}s", [e for e in getattr(self, f"failed_{kind}s") if e.get('url') != url])
+        getattr(self, f"_failed_{kind}_index").pop(url, None)
+    
+    def _add_failed(self, kind: str, url: str, error) -> Dict:
+        """
+        Track a failed item for later retry. Logged to the progress log right away, so failures
+        (and their attempt counts) survive a hard kill before the next compaction.
+        """
+        error, timestamp = str(error), datetime.now().isoformat()
+        entry = self._apply_failure(kind, url, error, timestamp)
+        self._append_progress_log({f"failed_{kind}": url, "error": error, "timestamp": timestamp})
+        return entry
+    
+    def _add_failed_event(self, event_url: str, error: str):
+        """Track failed event for later retry"""
+        entry = self._add_failed("event", event_url, error)
+        if entry["attempts"] > 1:
+            self.logger.warning(f"Event failed again (attempt {entry['attempts']}): {event_url}")
+        else:
+            self.logger.error(f"Event failed: {event_url} - {error}")
     
     def _add_failed_fighter(self, fighter_url: str, error: str):
         """Track failed fighter for later retry"""
-        failed_entry = {
-            "url": fighter_url,
-            "error": str(error),
-            "timestamp": datetime.now().isoformat(),
-            "attempts": 1
-        }
-        
-        # Check if this fighter already failed before
-        for i, existing in enumerate(self.failed_fighters):
-            if existing.get("url") == fighter_url:
-                existing["attempts"] += 1
-                existing["last_error"] = str(error)
-                existing["last_attempt"] = datetime.now().isoformat()
-                self.logger.warning(f"Fighter failed again (attempt {existing['attempts']}): {fighter_url}")
-                return
-        
-        self.failed_fighters.append(failed_entry)
-        self.logger.error(f"Fighter failed: {fighter_url} - {error}")
+        entry = self._add_failed("fighter", fighter_url, error)
+        if entry["attempts"] > 1:
+            self.logger.warning(f"Fighter failed again (attempt {entry['attempts']}): {fighter_url}")
+        else:
+            self.logger.error(f"Fighter failed: {fighter_url} - {error}")
     
     def _handle_rate_limit_error(self, error: Exception, context: str):
         """Handle rate limiting with exponential backoff"""
@@ -278,24 +657,47 @@ class ESPNMMAScraper:
             return True
         return False
     
-    def _polite_delay(self):
-        """Add random delay between requests with occasional longer breaks"""
+    def _polite_delay(self, url: str = ""):
+        """
+        Pace requests per host, with occasional longer breaks. Each host has a schedule shared by
+        all worker threads: a request waits for its slot, and the next slot is a random delay_range
+        gap later (divided across max_workers, so --workers N allows N requests per gap in total).
+        Time spent downloading and parsing counts towards the gap instead of being added to it.
+        """
         # Occasional longer break to be extra polite
         if random.random() < 0.05:  # 5% chance
             longer_delay = random.uniform(10, 20)
             self.logger.info(f"Taking extended break: {longer_delay:.1f} seconds")
             time.sleep(longer_delay)
-        else:
-            time.sleep(random.uniform(*self.delay_range))
+            return
+        
+        host = urlparse(url).netloc if url else ""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_slot.get(host, now))
+            self._host_next_slot[host] = slot + random.uniform(*self.delay_range) / self.max_workers
+        if slot > now:
+            time.sleep(slot - now)
     
-    def _get_page(self, url: str, max_retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a page with error handling and retries"""
+    def _get_page(self, url: str, max_retries: Optional[int] = None, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a page with error handling and retries (self.max_retries attempts by default).
+        parse_only limits the tree to the matching elements (e.g. just the <table>s).
+        """
+        return self._parse_page(url, self._fetch_page(url, max_retries), parse_only)
+    
+    def _fetch_page(self, url: str, max_retries: Optional[int] = None) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Download a page with retries. Returns (body, declared encoding or None), or None on failure."""
+        max_retries = max_retries or self.max_retries
         for attempt in range(max_retries):
             try:
-                self._polite_delay()
+                if not self._is_cached(url):
+                    self._polite_delay(url)
                 response = self.session.get(url, timeout=30)
                 response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                # A charset declared in the headers saves bs4 from sniffing the bytes for an encoding
+                declared = 'charset=' in response.headers.get('Content-Type', '').lower()
+                return response.content, (response.encoding if declared else None)
             except requests.exceptions.RequestException as e:
                 if self._handle_rate_limit_error(e, f"GET {url}"):
                     continue  # Try again after rate limit delay
@@ -304,7 +706,7 @@ class ESPNMMAScraper:
                     self.logger.error(f"Failed to fetch {url} after {max_retries} attempts: {e}")
                     return None
                 else:
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff
+                    wait_time = min(2 ** attempt, self.MAX_BACKOFF) + random.uniform(0, 1)  # Exponential backoff, capped
                     self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}. Retrying in {wait_time:.1f}s...")
                     time.sleep(wait_time)
             except Exception as e:
@@ -312,18 +714,66 @@ class ESPNMMAScraper:
                 return None
         return None
     
+    def _parse_page(self, url: str, fetched: Optional[Tuple[bytes, Optional[str]]],
+                    parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Parse what _fetch_page returned (None stays None)"""
+        if fetched is None:
+            return None
+        content, encoding = fetched
+        try:
+            return BeautifulSoup(content, 'lxml', parse_only=parse_only, from_encoding=encoding)
+        except Exception as e:
+            self.logger.error(f"Unexpected error parsing {url}: {e}")
+            return None
+    
+    def _is_cached(self, url: str) -> bool:
+        """True if the HTTP cache already holds this URL (no request, so no polite delay needed)"""
+        if not self.http_cache:
+            return False
+        try:
+            return self.session.cache.contains(url=url)
+        except Exception:
+            return False
+    
+    def _get_pages(self, urls: List[str]) -> Dict[str, Optional[BeautifulSoup]]:
+        """
+        Fetch several pages, up to max_workers at a time. Returns {url: soup or None}.
+        Worker threads only download (which releases the GIL); parsing happens in the calling
+        thread, unless the interpreter is free-threaded and the workers can parse in parallel.
+        """
+        urls = list(dict.fromkeys(urls))
+        if self.max_workers <= 1 or len(urls) <= 1:
+            return {url: self._get_page(url) for url in urls}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            if GIL_DISABLED:
+                return dict(zip(urls, pool.map(self._get_page, urls)))
+            return self._parse_pages(dict(zip(urls, pool.map(self._fetch_page, urls))))
+    
+    def _parse_pages(self, fetched: Dict[str, Optional[Tuple[bytes, Optional[str]]]]) -> Dict[str, Optional[BeautifulSoup]]:
+        return {url: self._parse_page(url, f) for url, f in fetched.items()}
+
+    def _absurl(self, href: str) -> Optional[str]:
+        """urljoin(base_url, href) with string fast paths for the usual absolute / root-relative hrefs"""
+        if not href:
+            return None
+        if href.startswith(('https://', 'http://')):
+            return href
+        if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+            return self._base_prefix + href
+        return urljoin(self.base_url, href)
+
     def _extract_id_from_url(self, url: str) -> str:
         """Extract ID from ESPN URLs (works for fighters and events)"""
         if not url:
             return ""
-        match = re.search(r'/id/(\d+)', url)
+        match = _RE_ID.search(url)
         return match.group(1) if match else ""
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return ""
-        return re.sub(r'\s+', ' ', text.strip())
+        return _clean_text(text)
 
     def _parse_schedule_date(self, text: str, year: int) -> Optional[str]:
         """
@@ -332,7 +782,14 @@ class ESPNMMAScraper:
         """
         if not text:
             return None
-        m = re.match(r'([A-Za-z]{3})\s+(\d{1,2})', text.strip())
+        s = text.strip()
+        # Fast path for the usual 'Sep 28' / 'Sep 8' shape; anything else goes through the regex
+        if len(s) >= 5 and s[3] == ' ' and s[4] in _DIGITS:
+            mon = MONTHS.get(s[:3].title())
+            if mon:
+                day = int(s[4:6]) if len(s) > 5 and s[5] in _DIGITS else int(s[4])
+                return f"{year:04d}-{mon:02d}-{day:02d}"
+        m = _RE_SCHED_DATE.match(s)
         if not m:
             return self._clean_text(text)
         mon = MONTHS.get(m.group(1).title())
@@ -348,22 +805,11 @@ class ESPNMMAScraper:
         """
         t = self._clean_text(text).lower()
         # strip punctuation and spaces
-        t = re.sub(r'[^a-z]', '', t)
-
-        # Map normalized header tokens to canonical keys
-        mapping = {
-            'date': 'date',
-            'opponent': 'opponent',
-            'res': 'result',
-            'result': 'result',
-            'decision': 'method',   # ESPN often labels the method column as "Decision"
-            'method': 'method',
-            'rnd': 'round',
-            'round': 'round',
-            'time': 'time',
-            'event': 'event',
-        }
-        return mapping.get(t, t)  # fallback to whatever we got
+        if t.isascii():
+            t = t.translate(_HEADER_TRANS)
+        else:
+            t = _RE_NONALPHA.sub('', t)
+        return _HEADER_CANONICAL.get(t, t)  # fallback to whatever we got
 
     # --------------------------- NEW: Stats-table helpers ---------------------------
 
@@ -390,12 +836,18 @@ class ESPNMMAScraper:
         if not table:
             return out
 
+        # Walk thead/tbody as direct children instead of CSS descendant selects;
+        # these tables are flat, so there is nothing nested to search for.
+        thead = table.find("thead", recursive=False)
+        tbody = table.find("tbody", recursive=False)
+
         # headers as-is (keep labels like "SDBL/A", "TSL-TSA", "TK ACC")
         headers = [
-            th.get_text(strip=True).replace("\xa0", " ").strip()
-            for th in table.select("thead th")
+            sys.intern(th.get_text(strip=True).replace("\xa0", " ").strip())
+            for tr in (thead.find_all("tr", recursive=False) if thead else [])
+            for th in tr.find_all("th", recursive=False)
         ]
-        idx_to_header = {i: h for i, h in enumerate(headers)}
+        n_headers = len(headers)
 
         def td_text(td):
             s = td.get_text(" ", strip=True).replace("\xa0", " ").strip()
@@ -405,24 +857,24 @@ class ESPNMMAScraper:
             a = td.find("a", attrs={"data-game-link": True}) or td.find("a")
             if not a or not a.get("href"):
                 return None, None
-            href = urljoin(self.base_url, a["href"])
+            href = self._absurl(a["href"])
             return href, self._extract_id_from_url(href)
 
         def parse_opponent(td):
             a = td.find("a")
             name = (a.get_text(" ", strip=True) if a else td_text(td)) or None
-            href = urljoin(self.base_url, a["href"]) if a and a.get("href") else None
+            href = self._absurl(a["href"]) if a and a.get("href") else None
             oid = self._extract_id_from_url(href) if href else None
             return name, href, oid
 
-        for tr in table.select("tbody tr"):
-            tds = tr.find_all("td")
+        for tr in (tbody.find_all("tr", recursive=False) if tbody else []):
+            tds = tr.find_all("td", recursive=False)
             if not tds:
                 continue
 
             row: Dict[str, Any] = {}
             for i, td in enumerate(tds):
-                col = idx_to_header.get(i, f"col_{i}")
+                col = headers[i] if i < n_headers else f"col_{i}"
                 if col == "Date":
                     row["date"] = td_text(td)
                 elif col == "Opponent":
@@ -436,13 +888,11 @@ class ESPNMMAScraper:
                 else:
                     row[col] = td_text(td)
 
-            metrics = {
-                k: v for k, v in row.items()
-                if k not in {"date", "opponent", "opponent_url", "opponent_id", "event_url", "event_id", "result"}
-            }
-            join_key = str(row.get("event_id") or f"{row.get('date')}|{row.get('opponent')}")
+            metrics = {k: v for k, v in row.items() if k not in _STATS_META_KEYSET}
+            # event_id is already a str; the fallback key stays a string since it is written to JSON
+            join_key = row.get("event_id") or f"{row.get('date')}|{row.get('opponent')}"
             out[join_key] = {
-                "meta": {k: row.get(k) for k in ("date","opponent","opponent_url","opponent_id","event_url","event_id","result")},
+                "meta": {k: row.get(k) for k in _STATS_META_KEYS},
                 "metrics": metrics
             }
 
@@ -457,18 +907,25 @@ class ESPNMMAScraper:
             return fights
 
         # combine sectioned stats into: {join_key -> {'striking': {...}, ...}}
+        # (event ids and join keys are already strings)
         combined: Dict[str, Dict[str, Any]] = {}
         for section in ("striking", "clinch", "ground"):
-            for key, payload in stats_by_section.get(section, {}).items():
-                eid_or_key = str(payload["meta"].get("event_id") or key)
-                combined.setdefault(eid_or_key, {})[section] = payload["metrics"]
+            for key, payload in (stats_by_section.get(section) or {}).items():
+                k = payload["meta"].get("event_id") or key
+                bucket = combined.get(k)
+                if bucket is None:
+                    combined[k] = bucket = {}
+                bucket[section] = payload["metrics"]
+
+        if not combined:
+            return fights
 
         for f in fights:
-            jkey = str(f.get("event_id") or f"{f.get('date')}|{f.get('opponent')}")
-            if jkey in combined:
+            jkey = f.get("event_id") or f"{f.get('date')}|{f.get('opponent')}"
+            bucket = combined.get(jkey)
+            if bucket:
                 # Only attach sections that exist for this fight
-                for section, metrics in combined[jkey].items():
-                    f[section] = metrics
+                f.update(bucket)
 
         return fights
 
@@ -486,20 +943,19 @@ class ESPNMMAScraper:
             if 'prelim' in t: return "Prelims"
             return self._clean_text(title_text) or "Unknown"
 
+        anchor_comp: Dict[int, Any] = {}     # fighter link -> nearest competitor container
+        comp_names: Dict[int, str] = {}      # competitor container -> display name
+
+        def _is_competitor(tag) -> bool:
+            return bool(_RE_COMPETITOR_CLASS.search(' '.join(tag.get('class') or [])))
+
         def _name_from_anchor_local(a) -> str:
-            # 1) nearest competitor container
-            comp = a.find_parent(class_=re.compile(r'(?:^| )(?:MMA)?Competitor(?: |$)'))
+            # 1) nearest competitor container (usually found during the card pass below)
+            comp = anchor_comp.get(id(a)) or a.find_parent(class_=_RE_COMPETITOR_CLASS)
             if comp:
-                for sel in [
-                    '.MMACompetitor__Name', '.Competitor__Name',
-                    '.MMACompetitor__Detail h2', '.Competitor__Detail h2',
-                    'h2', 'h3', '.name', '.player__name'
-                ]:
-                    el = comp.select_one(sel)
-                    if el:
-                        txt = self._clean_text(el.get_text())
-                        if txt and txt.lower() not in ('full profile', 'profile'):
-                            return txt
+                txt = self._name_in_container(comp, _CARD_NAME_SELECTORS, comp_names)
+                if txt:
+                    return txt
             # 2) fallback: within the link
             link_txt = self._clean_text(a.get_text())
             if link_txt and link_txt.lower() not in ('full profile', 'profile'):
@@ -507,41 +963,72 @@ class ESPNMMAScraper:
             # 3) fallback: slug
             return self._slug_to_name(a.get('href', ''))
 
-        for el in content_area.find_all(['header', 'div'], recursive=True):
-            classes = el.get('class') or []
+        # Class tokens never contain spaces, so a substring test on the joined class string
+        # is the same as testing each token (and 'MMAFightCard' already covers '..__Gamestrip')
+        def _is_segment_header(el) -> bool:
+            return el.name == 'header' and 'Card__Header' in ' '.join(el.get('class') or ())
+
+        def _is_bout(el) -> bool:
+            classes = ' '.join(el.get('class') or ())
+            return 'MMAFightCard' in classes or 'Gamestrip' in classes
+
+        def _is_card_node(tag) -> bool:
+            if tag.name == 'a':
+                return '/mma/fighter/_/id/' in (tag.get('href') or '')
+            return tag.name in ('header', 'div') and (_is_segment_header(tag) or _is_bout(tag))
+
+        # One document-order pass collects segment headers, bout cards and fighter links.
+        # Each link is credited to every enclosing bout (bouts can nest), so we never
+        # re-walk a bout's subtree to find its links.
+        card_nodes = []
+        bout_links: Dict[int, List[Any]] = {}
+        for el in content_area.find_all(_is_card_node):
+            if el.name == 'a':
+                for parent in el.parents:
+                    links = bout_links.get(id(parent))
+                    if links is not None:
+                        links.append(el)
+                    if id(el) not in anchor_comp and _is_competitor(parent):
+                        anchor_comp[id(el)] = parent
+                    if parent is content_area:
+                        break
+                continue
+            card_nodes.append(el)
+            if not _is_segment_header(el):
+                bout_links[id(el)] = []
 
+        for el in card_nodes:
             # Segment headers
-            if el.name == 'header' and any('Card__Header' in c for c in classes):
-                title_el = el.find(re.compile('^h[1-6]$'), class_=re.compile(r'Card__Header__Title'))
+            if _is_segment_header(el):
+                title_el = el.find(_RE_HEADING, class_=_RE_CARD_HEADER_TITLE)
                 if title_el:
                     current_segment = _normalize_segment(title_el.get_text())
                     segments.setdefault(current_segment, [])
                 continue
 
             # Bout cards
-            if any(s in c for c in classes for s in ('MMAFightCard', 'MMAFightCard__Gamestrip', 'Gamestrip')):
-                links = el.select('a[href*="/mma/fighter/_/id/"]')
-                fids, fnames = [], []
-                seen = set()
-
-                for a in links:
-                    fid = self._extract_id_from_url(a.get('href', ''))
-                    if not fid or fid in seen:
-                        continue
-                    seen.add(fid)
-                    fids.append(fid)
-                    fnames.append(_name_from_anchor_local(a))
-                    if len(fids) == 2:
-                        break
+            links = bout_links[id(el)]
+            fids, fnames = [], []
+            seen = set()
 
+            for a in links:
+                fid = self._extract_id_from_url(a.get('href', ''))
+                if not fid or fid in seen:
+                    continue
+                seen.add(fid)
+                fids.append(fid)
+                fnames.append(_name_from_anchor_local(a))
                 if len(fids) == 2:
-                    fight = {
-                        'fighter_ids': fids,
-                        'fighter_names': fnames,
-                        'card_segment': current_segment,
-                        'bout_order_in_segment': len(segments.get(current_segment, [])),
-                    }
-                    segments.setdefault(current_segment, []).append(fight)
+                    break
+
+            if len(fids) == 2:
+                fight = {
+                    'fighter_ids': fids,
+                    'fighter_names': fnames,
+                    'card_segment': current_segment,
+                    'bout_order_in_segment': len(segments.get(current_segment, [])),
+                }
+                segments.setdefault(current_segment, []).append(fight)
 
         return segments
 
@@ -560,36 +1047,30 @@ class ESPNMMAScraper:
             'performance bonus'
         ]
         
-        # Check in various potential locations
-        search_areas = [
-            soup.find('div', class_='PageLayout__Main'),
-            soup.find('section', class_='Card'),
-            soup.find('div', class_='EventHeader'),
-            soup  # fallback to entire page
-        ]
-        
-        for area in search_areas:
-            if not area:
+        # The old per-area scan (main layout, first Card, EventHeader, whole page) always
+        # ended with the whole page, so the last matching text node won for each key.
+        # Walk the page's strings once, back to front, and keep the first hit per key.
+        wanted = {'fight_of_the_night', 'performance_of_the_night', 'bonus_mention'}
+        for element in reversed(soup.find_all(string=True)):
+            element_text = element.strip().lower() if element else ""
+            if not element_text or not any(indicator in element_text for indicator in bonus_indicators):
                 continue
-                
-            # Look for any text containing bonus keywords
-            for element in area.find_all(text=True):
-                element_text = element.strip().lower() if element else ""
-                
-                for indicator in bonus_indicators:
-                    if indicator in element_text:
-                        # Found bonus mention - try to extract more context
-                        parent = element.parent if hasattr(element, 'parent') else None
-                        if parent:
-                            context_text = self._clean_text(parent.get_text())
-                            
-                            # Store what we found
-                            if 'fight of the night' in element_text:
-                                bonuses['fight_of_the_night'] = context_text
-                            elif 'performance of the night' in element_text:
-                                bonuses['performance_of_the_night'] = context_text
-                            else:
-                                bonuses['bonus_mention'] = context_text
+
+            if 'fight of the night' in element_text:
+                key = 'fight_of_the_night'
+            elif 'performance of the night' in element_text:
+                key = 'performance_of_the_night'
+            else:
+                key = 'bonus_mention'
+            if key in bonuses:
+                continue
+
+            # Found bonus mention - try to extract more context
+            parent = element.parent
+            if parent:
+                bonuses[key] = self._clean_text(parent.get_text())
+                if len(bonuses) == len(wanted):
+                    break
         
         return bonuses
 
@@ -601,7 +1082,8 @@ class ESPNMMAScraper:
         Only process 'Past Results' tables (they include 'Fight of the Night').
         """
         url = f"{self.base_url}/mma/schedule/_/year/{year}"
-        soup = self._get_page(url)
+        # Only the schedule tables are used; skip building the rest of the (large) page
+        soup = self._get_page(url, parse_only=_SCHEDULE_STRAINER)
         if not soup:
             return []
 
@@ -640,7 +1122,7 @@ class ESPNMMAScraper:
                 if not (a and '/mma/fightcenter/_/id/' in a['href']):
                     continue
 
-                event_url = urljoin(self.base_url, a['href'])
+                event_url = self._absurl(a['href'])
                 if event_url in seen_urls:
                     continue
                 seen_urls.add(event_url)
@@ -655,7 +1137,7 @@ class ESPNMMAScraper:
                 location = self._clean_text(tds[idx_location].get_text()) if idx_location is not None and idx_location < len(tds) else ""
 
                 # League
-                league_match = re.search(r'/league/([a-z0-9-]+)', event_url)
+                league_match = _RE_LEAGUE.search(event_url)
                 league = league_match.group(1).lower() if league_match else None
 
                 if self.allowed_leagues and (league not in self.allowed_leagues):
@@ -680,167 +1162,211 @@ class ESPNMMAScraper:
         return events
 
     
+    async def _ensure_browser_context(self):
+        """
+        Start Playwright, launch Chromium and open the shared browser context on first use.
+        Returns the context; it (and its cookies/cache) is reused for every later event.
+        """
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+        if self._context is None:
+            self._context = await self._browser.new_context(
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            )
+            # Short defaults so one slow page can't stall the crawl; each wait below catches its timeout
+            self._context.set_default_timeout(15000)
+            self._context.set_default_navigation_timeout(20000)
+            # Registered once on the context, so every page inherits the resource blocking
+            await self._context.route("**/*", self._route_request)
+        return self._context
+
+    async def _aclose_browser(self):
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _route_request(self, route):
+        """Abort images/media/fonts and ad/analytics requests; let everything else through"""
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(h in request.url for h in _BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _run_async(self, coro):
+        """Run a coroutine on the scraper's own event loop (the browser is bound to it)"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """Shut down the shared browser (if one was started) and the HTTP session"""
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.run_until_complete(self._aclose_browser())
+            except Exception as e:
+                self.logger.warning(f"Error closing browser: {e}")
+            finally:
+                self._loop.close()
+        self._loop = None
+        self._context = None
+        self._browser = None
+        self._playwright = None
+        self.session.close()
+
     async def scrape_event_with_browser(self, event_url: str) -> Dict:
         """Scrape event page using browser automation to expand all sections"""
         if not PLAYWRIGHT_AVAILABLE:
             print("Playwright not available, falling back to requests method")
             return self._scrape_event_requests(event_url)
             
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            )
-            page = await context.new_page()
-            
-            # Set longer timeout for slow-loading ESPN pages
-            page.set_default_timeout(60000)  # 60 seconds
+        # One browser + context per scraper; each event only opens (and closes) a page
+        context = await self._ensure_browser_context()
+        page = await context.new_page()
+        
+        try:
+            # Navigate to the page with less strict loading requirements
+            print(f"Loading event page: {event_url}")
+            try:
+                await page.goto(event_url, wait_until='domcontentloaded')
+                print("Page loaded (DOM ready)")
+            except Exception as e:
+                print(f"Timeout during page load, but continuing anyway: {e}")
+                # Continue - page might still be partially usable
             
+            # Wait for ESPN's JS to render the fight card instead of a fixed sleep
             try:
-                # Navigate to the page with less strict loading requirements
-                print(f"Loading event page: {event_url}")
-                try:
-                    await page.goto(event_url, wait_until='domcontentloaded', timeout=45000)
-                    print("Page loaded (DOM ready)")
-                except Exception as e:
-                    print(f"Timeout during page load, but continuing anyway: {e}")
-                    # Continue - page might still be partially usable
-                
-                # Wait for initial JavaScript to execute
-                await page.wait_for_timeout(5000)  # Give more time for ESPN's JS to load
-                
-                # Debug: Let's examine the page structure before attempting expansion
+                await page.wait_for_selector('.MMAFightCard__Gamestrip, [data-testid="gameStripBarCaret"]', timeout=8000)
+            except Exception as e:
+                print(f"Fight card not rendered before timeout, continuing anyway: {e}")
+            
+            # Debug: Let's examine the page structure before attempting expansion
+            # (each query is a browser round-trip, so only with --debug)
+            if self.debug:
                 print("=== DEBUGGING PAGE STRUCTURE ===")
-                
+            
                 # Check what fight cards exist
                 try:
                     all_fight_cards = await page.query_selector_all('.MMAFightCard__Gamestrip')
                     open_fight_cards = await page.query_selector_all('.MMAFightCard__Gamestrip--open')
                     print(f"Total fight cards found: {len(all_fight_cards)}")
                     print(f"Open fight cards found: {len(open_fight_cards)}")
-                    
+                
                     # Show classes of first few cards
                     for i, card in enumerate(all_fight_cards[:5]):
                         classes = await card.get_attribute('class')
                         print(f"  Card {i} classes: {classes}")
-                        
+                    
                 except Exception as e:
                     print(f"Error examining fight cards: {e}")
-                
+            
                 # Check for caret elements
                 try:
                     caret_elements = await page.query_selector_all('[data-testid="gameStripBarCaret"]')
                     print(f"Caret elements found: {len(caret_elements)}")
-                    
+                
                     # Examine first few carets
                     for i, caret in enumerate(caret_elements[:5]):
                         is_visible = await caret.is_visible()
                         classes = await caret.get_attribute('class')
                         print(f"  Caret {i}: visible={is_visible}, classes={classes}")
-                        
+                    
                         # Check for SVG icons within
                         down_arrow = await caret.query_selector('svg[data-icon="playerControls-downCarot"]')
                         up_arrow = await caret.query_selector('svg[data-icon="playerControls-upCarot"]')
                         print(f"    Down arrow: {down_arrow is not None}, Up arrow: {up_arrow is not None}")
-                        
+                    
                 except Exception as e:
                     print(f"Error examining carets: {e}")
-                
+            
                 # Check current profile links before expansion
                 try:
                     pre_expansion_profiles = await page.query_selector_all('a.MMAFightCenter__ProfileLink')
                     print(f"Profile links before expansion: {len(pre_expansion_profiles)}")
                 except Exception as e:
                     print(f"Error checking pre-expansion profiles: {e}")
-                
-                print("=== ATTEMPTING EXPANSION ===")
-                
-                # Strategy 1: Try clicking all carets with detailed feedback
-                expanded_count = 0
-                try:
-                    caret_elements = await page.query_selector_all('[data-testid="gameStripBarCaret"]')
-                    print(f"Attempting to click {len(caret_elements)} carets")
-                    
-                    for i, caret in enumerate(caret_elements):
-                        try:
-                            print(f"Processing caret {i}...")
-                            
-                            # Check visibility
-                            is_visible = await caret.is_visible()
-                            if not is_visible:
-                                print(f"  Caret {i} not visible, skipping")
-                                continue
-                            
-                            # Get current state
-                            down_arrow = await caret.query_selector('svg[data-icon="playerControls-downCarot"]')
-                            up_arrow = await caret.query_selector('svg[data-icon="playerControls-upCarot"]')
-                            
-                            print(f"  Caret {i} state - Down: {down_arrow is not None}, Up: {up_arrow is not None}")
-                            
-                            # Only click if it has a down arrow (collapsed state)
-                            if down_arrow:
-                                print(f"  Clicking collapsed caret {i}...")
-                                await caret.click()
-                                expanded_count += 1
-                                
-                                # Wait and check if state changed
-                                await page.wait_for_timeout(1500)
-                                
-                                # Check new state
-                                new_down_arrow = await caret.query_selector('svg[data-icon="playerControls-downCarot"]')
-                                new_up_arrow = await caret.query_selector('svg[data-icon="playerControls-upCarot"]')
-                                
-                                print(f"  After click - Down: {new_down_arrow is not None}, Up: {new_up_arrow is not None}")
-                                
-                                # Check if profile links increased
-                                current_profiles = await page.query_selector_all('a.MMAFightCenter__ProfileLink')
-                                print(f"  Profile links now: {len(current_profiles)}")
-                            else:
-                                print(f"  Caret {i} already expanded (up arrow), skipping to avoid collapsing")
-                            
-                        except Exception as e:
-                            print(f"  Error with caret {i}: {e}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"Error in caret expansion: {e}")
-                
-                print(f"=== EXPANSION COMPLETE - {expanded_count} attempts ===")
-                
-                # Final state check
+            
+            print("=== ATTEMPTING EXPANSION ===")
+            
+            # Click every visible collapsed caret in one in-page call instead of a
+            # query/click/wait round-trip per caret, then wait until none are left collapsed
+            expanded_count = 0
+            try:
+                expanded_count = await page.evaluate(_EXPAND_CARETS_JS) or 0
+                print(f"Clicked {expanded_count} collapsed carets")
+                if expanded_count:
+                    try:
+                        await page.wait_for_function(_CARETS_EXPANDED_JS, timeout=5000)
+                    except Exception as e:
+                        print(f"Some carets still collapsed after waiting: {e}")
+            except Exception as e:
+                print(f"Error in caret expansion: {e}")
+            
+            print(f"=== EXPANSION COMPLETE - {expanded_count} attempts ===")
+            
+            # Final state check
+            if self.debug:
                 try:
                     final_open_cards = await page.query_selector_all('.MMAFightCard__Gamestrip--open')
                     final_profile_links = await page.query_selector_all('a.MMAFightCenter__ProfileLink')
                     final_down_arrows = await page.query_selector_all('svg[data-icon="playerControls-downCarot"]')
                     final_up_arrows = await page.query_selector_all('svg[data-icon="playerControls-upCarot"]')
-                    
+                
                     print(f"Final state:")
                     print(f"  Open cards: {len(final_open_cards)}")
                     print(f"  Profile links: {len(final_profile_links)}")  
                     print(f"  Down arrows remaining: {len(final_down_arrows)}")
                     print(f"  Up arrows present: {len(final_up_arrows)}")
-                    
+                
                 except Exception as e:
                     print(f"Error in final state check: {e}")
-                
-                # Wait for any final animations
-                await page.wait_for_timeout(2000)
-                
-                # Get the page content
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Now extract fighter data from the fully expanded page
-                event_data = self._extract_event_data_from_soup(soup, event_url)
-                
-                return event_data
-                
+            
+            # Wait until the profile-link count stops changing (expanded bouts have rendered)
+            try:
+                await page.wait_for_function(_PROFILE_LINKS_STABLE_JS, polling=250, timeout=6000)
             except Exception as e:
-                print(f"Error in browser scraping: {e}")
-                return {}
-            finally:
-                await context.close()
-                await browser.close()
+                print(f"Profile links still changing after timeout, continuing anyway: {e}")
+            
+            # Drop scripts/styles in the browser before serializing: they are most of the
+            # markup on ESPN pages and nothing downstream reads them
+            try:
+                await page.evaluate(_STRIP_NON_CONTENT_JS)
+            except Exception as e:
+                print(f"Could not strip scripts/styles before snapshot: {e}")
+            
+            # Get the page content
+            content = await page.content()
+            soup = BeautifulSoup(content, 'lxml')
+            
+            # Now extract fighter data from the fully expanded page
+            event_data = self._extract_event_data_from_soup(soup, event_url)
+            
+            return event_data
+            
+        except Exception as e:
+            print(f"Error in browser scraping: {e}")
+            return {}
+        finally:
+            await page.close()
+
+    async def _scrape_events_with_browser(self, event_urls: List[str]) -> Dict[str, Dict]:
+        """Scrape events in the shared browser context with at most max_workers pages open at once"""
+        await self._ensure_browser_context()  # start it once, before the tasks race for it
+        sem = asyncio.Semaphore(self.max_workers)
+
+        async def bounded(url):
+            async with sem:
+                return await self.scrape_event_with_browser(url)
+
+        results = await asyncio.gather(*(bounded(url) for url in event_urls))
+        return dict(zip(event_urls, results))
 
     def _extract_event_data_from_soup(self, soup: BeautifulSoup, event_url: str) -> Dict:
         """Extract event data from BeautifulSoup object"""
@@ -855,8 +1381,8 @@ class ESPNMMAScraper:
         if title_elem:
             title = title_elem.get_text(strip=True)
             # Remove ESPN suffix and "Fight Results" suffix
-            event_name = re.sub(r'\s*-\s*ESPN.*$', '', title)
-            event_name = re.sub(r'\s*Fight Results\s*$', '', event_name)
+            event_name = _RE_ESPN_SUFFIX.sub('', title)
+            event_name = _RE_FIGHT_RESULTS.sub('', event_name)
             event_data['name'] = event_name
         
         # NEW: Extract fight card segments and bonuses
@@ -877,73 +1403,47 @@ class ESPNMMAScraper:
             print(f"Error extracting fight bonuses: {e}")
             event_data['fight_bonuses'] = {}
         
-        # Collect fighter profile links - normalize to name-slug format
+        # Collect fighter profile links - normalize to name-slug format, deduplicate by fighter ID.
+        # One walk covers both sources: every MMA fighter link on the page (expanded and
+        # default-open) and, as backup, the data-player-uid attributes.
         fighter_urls_raw = set()
+        best: Dict[str, Tuple[bool, str]] = {}  # fighter ID -> (has_name_slug, url) of its best URL
+        n_links = n_uids = 0
         
-        # 1) Primary: Get ALL MMA fighter links on the page (expanded and default-open)
-        all_fighter_links = soup.select('a[href*="/mma/fighter/_/id/"]')
-        print(f"Found {len(all_fighter_links)} total fighter links")
-        
-        for link in all_fighter_links:
-            href = link.get('href', '')
+        for elem in soup.select(_FIGHTER_SOURCES_SELECTOR):
+            href = elem.get('href', '') if elem.name == 'a' else ''
+            candidates = []
             if '/mma/fighter/_/id/' in href:
-                full_url = urljoin(self.base_url, href)
-                fighter_urls_raw.add(full_url)
-        
-        # 2) Also extract from data-player-uid attributes as backup
-        uid_elements = soup.find_all(attrs={"data-player-uid": True})
-        print(f"Found {len(uid_elements)} elements with data-player-uid")
-        
-        for elem in uid_elements:
-            uid = elem.get('data-player-uid', '')
-            id_match = re.search(r'~a:(\d+)', uid)
-            if id_match:
-                fighter_id = id_match.group(1)
-                # If this element is a link, use its href
-                if elem.name == 'a' and elem.get('href'):
-                    href = elem.get('href', '')
-                    if '/mma/fighter/_/id/' in href and fighter_id in href:
-                        full_url = urljoin(self.base_url, href)
-                        fighter_urls_raw.add(full_url)
-                else:
-                    # Fallback to ID-only URL 
-                    fighter_url = f"{self.base_url}/mma/fighter/_/id/{fighter_id}/"
-                    fighter_urls_raw.add(fighter_url)
-        
-        # 3) Normalize URLs: prefer name-slug format, deduplicate by fighter ID
-        fighter_urls = set()
-        id_to_slug_url = {}  # Map fighter IDs to their best URLs
-        
-        for url in fighter_urls_raw:
-            fighter_id = self._extract_id_from_url(url)
-            if not fighter_id:
-                continue
-                
-            # Check if URL has name slug (path continues after the ID)
-            url_parts = url.rstrip('/').split('/')
-            if len(url_parts) >= 6:  # .../mma/fighter/_/id/12345/name-slug
-                id_index = None
-                for i, part in enumerate(url_parts):
-                    if part == 'id' and i + 1 < len(url_parts):
-                        id_index = i + 1
-                        break
-                
-                if id_index and id_index + 1 < len(url_parts):
-                    # Has name slug after the ID
-                    has_name_slug = True
-                else:
-                    has_name_slug = False
-            else:
-                has_name_slug = False
+                n_links += 1
+                candidates.append(self._absurl(href))
+            uid = elem.get('data-player-uid')
+            if uid is not None:
+                n_uids += 1
+                id_match = _RE_FIGHTER_ID.search(uid)
+                if id_match:
+                    fighter_id = id_match.group(1)
+                    if not href:
+                        # Fallback to ID-only URL
+                        candidates.append(f"{self.base_url}/mma/fighter/_/id/{fighter_id}/")
             
-            # Prefer name-slug URLs over ID-only URLs
-            if has_name_slug:
-                id_to_slug_url[fighter_id] = url
-            elif fighter_id not in id_to_slug_url:
-                # Only use ID-only if we don't have name-slug version
-                id_to_slug_url[fighter_id] = url
+            for url in candidates:
+                if url in fighter_urls_raw:
+                    continue
+                fighter_urls_raw.add(url)
+                # Has name slug if the path continues after the ID (.../id/12345/name-slug)
+                fighter_id, has_name_slug = _parse_fighter_url(url)
+                if not fighter_id:
+                    continue
+                # Prefer name-slug URLs over ID-only URLs (ties broken by URL, so the pick is stable)
+                key = (has_name_slug, url)
+                prev = best.get(fighter_id)
+                if prev is None or key > prev:
+                    best[fighter_id] = key
+        
+        print(f"Found {n_links} total fighter links")
+        print(f"Found {n_uids} elements with data-player-uid")
         
-        fighter_urls = set(id_to_slug_url.values())
+        fighter_urls = {url for _, url in best.values()}
         
         print(f"Collected {len(fighter_urls_raw)} raw URLs, normalized to {len(fighter_urls)} unique fighters")
         
@@ -953,23 +1453,15 @@ class ESPNMMAScraper:
         
         # Extract names from card
         fighter_names = []
-        name_selectors = [
-            '.MMACompetitor__Detail h2',
-            '.Competitor__Detail h2', 
-            '.Fighter__Name',
-            '.player__name',
-            '[data-player-uid] h2',
-            '[data-player-uid] .name'
-        ]
-        
-        for selector in name_selectors:
-            for name_elem in soup.select(selector):
-                parts = [self._clean_text(x.get_text()) for x in name_elem.find_all('span')]
-                if not parts:
-                    parts = [self._clean_text(name_elem.get_text())]
-                parts = [p for p in parts if p]
-                if parts:
-                    fighter_names.append(' '.join(parts))
+        # One select over the union of the name selectors (each element is visited once;
+        # names are de-duplicated below anyway)
+        for name_elem in soup.select(_EVENT_NAME_SELECTOR):
+            parts = [self._clean_text(x.get_text()) for x in name_elem.find_all('span')]
+            if not parts:
+                parts = [self._clean_text(name_elem.get_text())]
+            parts = [p for p in parts if p]
+            if parts:
+                fighter_names.append(' '.join(parts))
         
         event_data['fighter_urls'] = sorted(list(fighter_urls))
         event_data['fighter_names_from_card'] = list(set(fighter_names))  # Remove duplicates
@@ -991,19 +1483,45 @@ class ESPNMMAScraper:
             return {}
         return self._extract_event_data_from_soup(soup, event_url)
     
+    def _event_from_fetch(self, event_url: str, fetched: Optional[Tuple[bytes, Optional[str]]]) -> Dict:
+        """Event data from a page downloaded by _fetch_page ({} if the download failed)"""
+        soup = self._parse_page(event_url, fetched)
+        if not soup:
+            return {}
+        return self._extract_event_data_from_soup(soup, event_url)
+    
     def scrape_event(self, event_url: str) -> Dict:
         """Main scrape_event method that chooses browser vs requests approach"""
         if self.use_browser:
-            return asyncio.run(self.scrape_event_with_browser(event_url))
+            return self._run_async(self.scrape_event_with_browser(event_url))
         else:
             return self._scrape_event_requests(event_url)
     
+    def scrape_events(self, event_urls: List[str]) -> Dict[str, Dict]:
+        """Scrape several events, up to max_workers at a time (threads for requests, pages for the browser)."""
+        if self.use_browser and PLAYWRIGHT_AVAILABLE:
+            return self._run_async(self._scrape_events_with_browser(list(dict.fromkeys(event_urls))))
+        soups = self._get_pages(event_urls)
+        return {
+            url: self._extract_event_data_from_soup(soup, url) if soup else {}
+            for url, soup in soups.items()
+        }
+    
+    def _fighter_page_urls(self, fighter_url: str) -> Dict[str, str]:
+        """The four pages that make up a fighter: profile, bio, stats and history"""
+        return {
+            'profile': fighter_url,
+            'bio': fighter_url.replace('/fighter/', '/fighter/bio/'),
+            'stats': fighter_url.replace('/fighter/', '/fighter/stats/'),
+            'history': fighter_url.replace('/fighter/', '/fighter/history/'),
+        }
+    
     def scrape_fighter_profile(self, fighter_url: str) -> Dict:
         """Scrape fighter profile page for basic info and fighting style"""
         soup = self._get_page(fighter_url)
-        if not soup:
-            return {}
-        
+        return self._parse_fighter_profile(soup, fighter_url) if soup else {}
+    
+    def _parse_fighter_profile(self, soup: BeautifulSoup, fighter_url: str) -> Dict:
         fighter_data: Dict[str, Any] = {
             'id': self._extract_id_from_url(fighter_url),
             'url': fighter_url
@@ -1018,40 +1536,41 @@ class ESPNMMAScraper:
         title_elem = soup.find('title')
         if title_elem:
             title = title_elem.get_text(strip=True)
-            name_match = re.match(r'^([^(]+)', title)
+            name_match = _RE_TITLE_NAME.match(title)
             if name_match:
                 fighter_data['name'] = self._clean_text(name_match.group(1))
         
-        # Fighting Style from table (best-effort, classes shift occasionally)
-        for table in soup.find_all('table', class_='Table'):
+        # Fighting Style from table (best-effort, classes shift occasionally).
+        # Go straight to its header cells instead of reading every table's headers; tables
+        # without a tbody are skipped and the first one with a tbody is used
+        for style_th in soup.find_all(_is_fighting_style_th):
+            table = style_th.find_parent('table')
             thead = table.find('thead')
-            if not thead:
-                continue
-            headers = [th.get_text(strip=True) for th in thead.find_all('th')]
-            if 'Fighting Style' not in headers:
-                continue
             tbody = table.find('tbody')
-            if not tbody:
+            if not thead or not tbody:
                 continue
-            for row in tbody.find_all('tr'):
-                cells = row.find_all('td')
-                if len(cells) < len(headers):
-                    continue
-                row_map = {headers[i]: self._clean_text(cells[i].get_text()) for i in range(len(headers))}
-                maybe_style = row_map.get('Fighting Style', '')
-                if maybe_style and maybe_style not in ['Height', 'Weight', 'Fighter', '-', '']:
-                    fighter_data['fighting_style'] = maybe_style
-                    break
+            headers = [th.get_text(strip=True) for th in thead.find_all('th')]
+            style_idx = headers.index('Fighting Style') if 'Fighting Style' in headers else -1
+            if style_idx >= 0:
+                n_headers = len(headers)
+                for row in tbody.find_all('tr'):
+                    cells = row.find_all('td')
+                    if len(cells) < n_headers:
+                        continue
+                    maybe_style = self._clean_text(cells[style_idx].get_text())
+                    if maybe_style and maybe_style not in ['Height', 'Weight', 'Fighter', '-', '']:
+                        fighter_data['fighting_style'] = maybe_style
+                        break
             break
         return fighter_data
     
     def scrape_fighter_bio(self, fighter_url: str) -> Dict:
         """Scrape fighter bio page for structured data"""
+        soup = self._get_page(self._fighter_page_urls(fighter_url)['bio'])
+        return self._parse_fighter_bio(soup, fighter_url) if soup else {}
+    
+    def _parse_fighter_bio(self, soup: BeautifulSoup, fighter_url: str) -> Dict:
         bio_url = fighter_url.replace('/fighter/', '/fighter/bio/')
-        soup = self._get_page(bio_url)
-        if not soup:
-            return {}
-        
         bio_data: Dict[str, Any] = {
             'id': self._extract_id_from_url(fighter_url),
             'bio_url': bio_url
@@ -1062,37 +1581,31 @@ class ESPNMMAScraper:
         if bio_section:
             for item in bio_section.find_all('div', class_='Bio__Item'):
                 label_elem = item.find('span', class_='Bio__Label')
-                value_elem = item.find('span', class_=re.compile(r'dib flex-uniform'))
+                value_elem = item.find('span', class_=_RE_DIB_UNIFORM)
                 if not (label_elem and value_elem):
                     continue
-                label = self._clean_text(label_elem.get_text()).lower()
+                key = _bio_label_key(self._clean_text(label_elem.get_text()).lower())
+                if key is None:
+                    continue
                 value = self._clean_text(value_elem.get_text())
-                if 'country' in label:
-                    bio_data['country'] = value
-                elif 'wt class' in label or 'weight class' in label:
-                    bio_data['weight_class'] = value
-                elif 'ht/wt' in label or 'height' in label:
-                    m = re.match(r"([^,]+),\s*(.+)", value)
+                if key == '_hw':
+                    m = _RE_HT_WT.match(value)
                     if m:
                         bio_data['height'] = self._clean_text(m.group(1))
                         bio_data['weight'] = self._clean_text(m.group(2))
                     else:
                         bio_data['height_weight'] = value
-                elif 'birthdate' in label:
-                    date_match = re.match(r'(\d{1,2}/\d{1,2}/\d{4})', value)
+                elif key == '_birth':
+                    date_match = _RE_BIRTHDATE.match(value)
                     if date_match:
                         bio_data['birthdate'] = date_match.group(1)
-                    age_match = re.search(r'\((\d+)\)', value)
+                    age_match = _RE_AGE.search(value)
                     if age_match:
                         bio_data['age'] = int(age_match.group(1))
-                elif 'team' in label:
-                    bio_data['team'] = value
-                elif 'nickname' in label:
-                    bio_data['nickname'] = value
-                elif 'stance' in label:
-                    bio_data['stance'] = value
-                elif 'reach' in label:
+                elif key == '_reach':
                     bio_data['reach'] = value.replace('"', '').strip()
+                else:
+                    bio_data[key] = value
         
         # Record block (labels vary a bit)
         stat_block = soup.find('aside', class_='StatBlock')
@@ -1118,10 +1631,11 @@ class ESPNMMAScraper:
         Scrape fighter stats page; parse the three titled tables
         (Striking / Clinch / Ground) into dicts keyed by event_id (fallback: date|opponent).
         """
+        soup = self._get_page(self._fighter_page_urls(fighter_url)['stats'])
+        return self._parse_fighter_stats(soup, fighter_url) if soup else {}
+    
+    def _parse_fighter_stats(self, soup: BeautifulSoup, fighter_url: str) -> Dict:
         stats_url = fighter_url.replace('/fighter/', '/fighter/stats/')
-        soup = self._get_page(stats_url)
-        if not soup:
-            return {}
         
         # Parse each section
         stats_sections = {}
@@ -1153,11 +1667,11 @@ class ESPNMMAScraper:
     
     def scrape_fighter_history(self, fighter_url: str) -> Dict:
         """Scrape fighter fight history page"""
+        soup = self._get_page(self._fighter_page_urls(fighter_url)['history'])
+        return self._parse_fighter_history(soup, fighter_url) if soup else {}
+    
+    def _parse_fighter_history(self, soup: BeautifulSoup, fighter_url: str) -> Dict:
         history_url = fighter_url.replace('/fighter/', '/fighter/history/')
-        soup = self._get_page(history_url)
-        if not soup:
-            return {}
-        
         history_data: Dict[str, Any] = {
             'id': self._extract_id_from_url(fighter_url),
             'history_url': history_url,
@@ -1190,9 +1704,9 @@ class ESPNMMAScraper:
             for i, cell in enumerate(cells):
                 text = self._clean_text(cell.get_text())
                 fight[f'col_{i}'] = text
-                if i == 0 and re.search(r'\d{1,2}/\d{1,2}/\d{4}', text):
+                if i == 0 and _RE_DATE.search(text):
                     fight['date'] = text
-                elif re.search(r'^\d+/\d+$', text):  # "5/10" style stats
+                elif _RE_STAT_SLASH.search(text):  # "5/10" style stats
                     fight[f'stat_{i}'] = text
                 elif text in ['W', 'L', 'D', 'NC']:
                     fight['result'] = text
@@ -1217,6 +1731,8 @@ class ESPNMMAScraper:
         if not headers or len(headers) < 3:
             headers = ['date', 'opponent', 'result', 'method', 'round', 'time', 'event']
 
+        n_headers = len(headers)
+
         for tr in tbody.find_all('tr'):
             tds = tr.find_all('td')
             if not tds:
@@ -1224,25 +1740,27 @@ class ESPNMMAScraper:
 
             entry: Dict[str, str] = {}
             for i, td in enumerate(tds):
-                key = headers[i] if i < len(headers) else None
-                value = self._clean_text(td.get_text())
+                key = headers[i] if i < n_headers else None
 
                 # Only store recognized fields; avoid emitting generic col_i duplicates
-                if key in ('date', 'opponent', 'result', 'method', 'round', 'time', 'event'):
-                    # Prefer anchor text for linked fields and capture URLs/IDs
-                    if key in ('opponent', 'event'):
-                        a = td.find('a', href=True)
-                        if a:
-                            link_text = self._clean_text(a.get_text()) or value
-                            href = urljoin(self.base_url, a['href'])
-                            value = link_text
-                            if key == 'opponent':
-                                entry['opponent_url'] = href
-                                entry['opponent_id'] = self._extract_id_from_url(href)
-                            else:
-                                entry['event_url'] = href
-                                entry['event_id'] = self._extract_id_from_url(href)
-                    entry[key] = value
+                if key not in _ALLOWED_HIST_KEYS:
+                    continue
+                value = self._clean_text(td.get_text())
+
+                # Prefer anchor text for linked fields and capture URLs/IDs
+                if key in _LINKED_HIST_KEYS:
+                    a = td.find('a', href=True)
+                    if a:
+                        link_text = self._clean_text(a.get_text()) or value
+                        href = self._absurl(a['href'])
+                        value = link_text
+                        if key == 'opponent':
+                            entry['opponent_url'] = href
+                            entry['opponent_id'] = self._extract_id_from_url(href)
+                        else:
+                            entry['event_url'] = href
+                            entry['event_id'] = self._extract_id_from_url(href)
+                entry[key] = value
 
             # Some pages label the method column as 'Decision'—already normalized to 'method' above.
             # Basic cleanup: uppercase single-letter results, keep 'NC' as-is.
@@ -1256,24 +1774,76 @@ class ESPNMMAScraper:
         return fights
 
     def scrape_complete_fighter(self, fighter_url: str) -> Dict:
-        """Scrape all available data for a fighter"""
+        """Scrape all available data for a fighter (its four pages are fetched up to max_workers at a time)"""
         print(f"Scraping complete data for fighter: {fighter_url}")
-        fighter_data = self.scrape_fighter_profile(fighter_url)
+        page_urls = self._fighter_page_urls(fighter_url)
+        return self._assemble_fighter(fighter_url, self._get_pages(list(page_urls.values())))
+    
+    def scrape_complete_fighters(self, fighter_urls: List[str]) -> Dict[str, Dict]:
+        """Scrape several fighters, up to max_workers at a time. Returns {fighter_url: data} (failures omitted)."""
+        return {url: data for url, data, error in self.iter_complete_fighters(fighter_urls) if error is None}
+    
+    def iter_complete_fighters(self, fighter_urls: List[str]) -> Iterator[Tuple[str, Dict, Optional[Exception]]]:
+        """
+        Scrape fighters up to max_workers at a time, yielding (fighter_url, data, error) as each
+        one finishes, so a slow fighter never holds back the others. In order when max_workers is 1.
+        """
+        fighter_urls = list(dict.fromkeys(fighter_urls))
+        if self.max_workers <= 1 or len(fighter_urls) <= 1:
+            for fighter_url in fighter_urls:
+                try:
+                    yield fighter_url, self.scrape_complete_fighter(fighter_url), None
+                except Exception as e:
+                    yield fighter_url, {}, e
+            return
+        
+        def scrape_one(fighter_url):
+            # Each worker takes one fighter and downloads its pages in turn; the pool bounds concurrency.
+            # As in _get_pages, parsing is left to this (the calling) thread unless the GIL is off.
+            print(f"Scraping complete data for fighter: {fighter_url}")
+            page_urls = self._fighter_page_urls(fighter_url).values()
+            fetched = {url: self._fetch_page(url) for url in page_urls}
+            return self._assemble_fighter(fighter_url, self._parse_pages(fetched)) if GIL_DISABLED else fetched
+        
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(fighter_urls)))
+        try:
+            futures = {pool.submit(scrape_one, url): url for url in fighter_urls}
+            for future in as_completed(futures):
+                fighter_url = futures[future]
+                try:
+                    result = future.result()
+                    if not GIL_DISABLED:
+                        result = self._assemble_fighter(fighter_url, self._parse_pages(result))
+                    yield fighter_url, result, None
+                except Exception as e:
+                    yield fighter_url, {}, e
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def _assemble_fighter(self, fighter_url: str, soups: Dict[str, Optional[BeautifulSoup]]) -> Dict:
+        """Merge profile, bio, stats and history (from already-fetched soups) into one fighter record"""
+        page_urls = self._fighter_page_urls(fighter_url)
+        
+        def parse(kind, parser):
+            soup = soups.get(page_urls[kind])
+            return parser(soup, fighter_url) if soup else {}
+        
+        fighter_data = parse('profile', self._parse_fighter_profile)
         
         # Bio
-        bio_data = self.scrape_fighter_bio(fighter_url)
+        bio_data = parse('bio', self._parse_fighter_bio)
         for k, v in bio_data.items():
             if k not in fighter_data:
                 fighter_data[k] = v
         
         # Stats
-        stats_data = self.scrape_fighter_stats(fighter_url)
+        stats_data = parse('stats', self._parse_fighter_stats)
         for k, v in stats_data.items():
             if k not in fighter_data:
                 fighter_data[k] = v
         
         # History
-        history_data = self.scrape_fighter_history(fighter_url)
+        history_data = parse('history', self._parse_fighter_history)
 
         # ---- NEW: attach Striking/Clinch/Ground metrics into each fight ----
         fights_list = history_data.get('fights', [])
@@ -1288,6 +1858,26 @@ class ESPNMMAScraper:
         
         return fighter_data
     
+    def _output_path(self, out_dir: str, name: str) -> str:
+        """events/fighters output path, with the compression suffix when compress_output is set"""
+        path = os.path.join(out_dir, name + ".jsonl")
+        if self.compress_output:
+            path += ".zst" if ZSTD_AVAILABLE else ".gz"
+        return path
+    
+    def _open_output(self, path: str):
+        """
+        Open a JSONL output for appending. Compressed outputs get a new frame/member per run
+        (zstd and gzip readers both read concatenated streams), and flush() ends a block so
+        everything written so far is readable even if the run is killed.
+        """
+        if path.endswith(".zst"):
+            cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+            return cctx.stream_writer(open(path, "ab"), closefd=True)
+        if path.endswith(".gz"):
+            return gzip.open(path, "ab", compresslevel=6)
+        return open(path, "ab", buffering=1 << 20)
+    
     def crawl_all(self, start_year=2025, end_year=1999, out_dir="espn_out", limit_events=None):
         """
         Crawl ESPN MMA data from start_year down to end_year (inclusive)
@@ -1295,8 +1885,8 @@ class ESPNMMAScraper:
         self.out_dir = out_dir  # Update if different from init
         os.makedirs(out_dir, exist_ok=True)
         
-        events_path = os.path.join(out_dir, "events.jsonl")
-        fighters_path = os.path.join(out_dir, "fighters.jsonl")
+        events_path = self._output_path(out_dir, "events")
+        fighters_path = self._output_path(out_dir, "fighters")
         
         total_events_processed = 0
         total_fighters_processed = 0
@@ -1305,6 +1895,15 @@ class ESPNMMAScraper:
         if limit_events:
             self.logger.info(f"Limited to {limit_events} events")
         
+        # Output files stay open for the whole run
+        events_fh = self._open_output(events_path)
+        fighters_fh = self._open_output(fighters_path)
+        
+        # With max_workers > 1 (requests mode) the next events' pages download in the background
+        # while the current event's fighters are being scraped
+        lookahead = self.max_workers if self.max_workers > 1 and not self.use_browser else 0
+        event_pool = ThreadPoolExecutor(max_workers=lookahead) if lookahead else None
+        
         try:
             for year in range(start_year, end_year - 1, -1):
                 self.logger.info(f"=== Scraping year {year} ===")
@@ -1316,32 +1915,67 @@ class ESPNMMAScraper:
                     self.logger.error(f"Failed to get schedule for year {year}: {e}")
                     continue
                 
+                pending = []
                 for i, event_info in enumerate(events):
-                    if limit_events and total_events_processed >= limit_events:
-                        self.logger.info(f"Reached event limit of {limit_events}")
-                        return
                     league_val = (event_info.get('league') or "").lower()
                     if self.allowed_leagues and (league_val not in self.allowed_leagues):
-                        self.logger.info(f"Skipping non-allowed league event: {event_info.get('name')} [{league_val}]")
+                        self.logger.info("Skipping non-allowed league event: %s [%s]", event_info.get('name'), league_val)
                         continue
                     
                     event_url = event_info['url']
                     
                     # Skip if already completed
                     if event_url in self.completed_events:
-                        self.logger.info(f"Skipping already completed event: {event_info.get('name', event_url)}")
+                        self.logger.info("Skipping already completed event: %s", event_info.get('name', event_url))
                         continue
                     
                     # Skip if failed too many times
-                    failed_attempts = sum(1 for f in self.failed_events if f.get('url') == event_url and f.get('attempts', 0) >= 3)
-                    if failed_attempts > 0:
-                        self.logger.warning(f"Skipping event with 3+ failed attempts: {event_url}")
+                    failed_entry = self._failed_event_index.get(event_url)
+                    if failed_entry is not None and failed_entry.get('attempts', 0) >= 3:
+                        self.logger.warning("Skipping event with 3+ failed attempts: %s", event_url)
                         continue
                     
-                    self.logger.info(f"Processing event {i+1}/{len(events)} for {year}: {event_info.get('name', 'Unknown')}")
+                    pending.append((i, event_info))
+                
+                # Event pages are fetched ahead (a rolling window in requests mode, batches of
+                # max_workers in browser mode); processing stays in order
+                prefetched: Dict[str, Dict] = {}
+                ahead: Dict[str, Future] = {}
+                for pos, (i, event_info) in enumerate(pending):
+                    if limit_events and total_events_processed >= limit_events:
+                        self.logger.info(f"Reached event limit of {limit_events}")
+                        return
+                    
+                    event_url = event_info['url']
+                    if event_pool is not None:
+                        window = lookahead
+                        if limit_events:
+                            window = min(window, limit_events - total_events_processed)
+                        for _, e in pending[pos:pos + window]:
+                            if e['url'] not in ahead:
+                                ahead[e['url']] = event_pool.submit(
+                                    self._scrape_event_requests if GIL_DISABLED else self._fetch_page, e['url'])
+                    elif event_url not in prefetched:
+                        batch_size = self.max_workers
+                        if limit_events:
+                            batch_size = min(batch_size, limit_events - total_events_processed)
+                        batch = [e['url'] for _, e in pending[pos:pos + batch_size]]
+                        try:
+                            prefetched = self.scrape_events(batch) if len(batch) > 1 else {}
+                        except Exception as e:
+                            self.logger.warning(f"Batch fetch failed, falling back to one event at a time: {e}")
+                            prefetched = {}
+                    
+                    self.logger.info("Processing event %d/%d for %d: %s", i + 1, len(events), year, event_info.get('name', 'Unknown'))
                     
                     try:
-                        event_data = self.scrape_event(event_url)
+                        if event_url in ahead:
+                            result = ahead.pop(event_url).result()
+                            event_data = result if GIL_DISABLED else self._event_from_fetch(event_url, result)
+                        elif event_url in prefetched:
+                            event_data = prefetched.pop(event_url)
+                        else:
+                            event_data = self.scrape_event(event_url)
                         if not event_data:
                             raise Exception("No event data returned")
                         
@@ -1352,59 +1986,75 @@ class ESPNMMAScraper:
 
                         fotn_txt = event_data.get('fight_of_the_night')
                         if fotn_txt and event_data.get('card_segments'):
-                            for seg, fights in event_data['card_segments'].items():
-                                for f in fights:
-                                    names = f.get('fighter_names') or []
-                                    if self._names_match_fotn(names, fotn_txt):
-                                        f['is_fotn'] = True
-                        
-                        # Save event
-                        with open(events_path, "a", encoding="utf-8") as f:
-                            f.write(json.dumps(event_data, ensure_ascii=False) + "\n")
+                            self._tag_fotn(event_data['card_segments'], fotn_txt)
                         
-                        self.completed_events.add(event_url)
-                        total_events_processed += 1
+                        # Save event (it is marked completed only once its fighters are saved too)
+                        events_fh.write(_to_jsonl(event_data))
+                        events_fh.flush()
                         
-                        self.logger.info(f"✓ Saved event: {event_data.get('name', 'Unknown')} [{event_data.get('date', '')}] - {len(event_data.get('fighter_urls', []))} fighters")
+                        self.logger.info("✓ Saved event: %s [%s] - %d fighters",
+                                         event_data.get('name', 'Unknown'), event_data.get('date', ''), len(event_data.get('fighter_urls', [])))
                         
                         # Process fighters
                         fighter_urls = event_data.get('fighter_urls', [])
-                        self.logger.info(f"Processing {len(fighter_urls)} fighters from this event")
+                        self.logger.info("Processing %d fighters from this event", len(fighter_urls))
                         
+                        fighters_todo = []
                         for j, fighter_url in enumerate(fighter_urls):
-                            if fighter_url in self.completed_fighters:
+                            if self._fighter_completed(fighter_url):
                                 continue
                             
                             # Skip if failed too many times
-                            failed_fighter_attempts = sum(1 for f in self.failed_fighters if f.get('url') == fighter_url and f.get('attempts', 0) >= 3)
-                            if failed_fighter_attempts > 0:
+                            failed_entry = self._failed_fighter_index.get(fighter_url)
+                            if failed_entry is not None and failed_entry.get('attempts', 0) >= 3:
                                 continue
                             
-                            try:
-                                fighter_data = self.scrape_complete_fighter(fighter_url)
-                                if not fighter_data:
-                                    raise Exception("No fighter data returned")
-                                
-                                with open(fighters_path, "a", encoding="utf-8") as f:
-                                    f.write(json.dumps(fighter_data, ensure_ascii=False) + "\n")
-                                
-                                self.completed_fighters.add(fighter_url)
-                                total_fighters_processed += 1
-                                
-                                if j % 5 == 0 or j == len(fighter_urls) - 1:  # Progress update every 5 fighters
-                                    self.logger.info(f"  ✓ Fighter progress: {j+1}/{len(fighter_urls)} - Latest: {fighter_data.get('name', 'Unknown')}")
-                                
-                            except Exception as e:
-                                self._add_failed_fighter(fighter_url, e)
-                                continue
+                            fighters_todo.append((j, fighter_url))
                         
-                        # Save progress after each event
-                        self._save_progress()
+                        # Fighters are scraped up to max_workers at a time and saved as each one finishes
+                        fighter_index = {u: j for j, u in fighters_todo}
+                        # Fighter records are collected for the whole event and written with one
+                        # write + flush at the end; only then are they logged as completed
+                        fighters_buf = bytearray()
+                        written_fighters = []
+                        try:
+                            for fighter_url, fighter_data, error in self.iter_complete_fighters(list(fighter_index)):
+                                j = fighter_index[fighter_url]
+                                try:
+                                    if error is not None:
+                                        raise error
+                                    if not fighter_data:
+                                        raise Exception("No fighter data returned")
+                                    
+                                    fighters_buf += _to_jsonl(fighter_data)
+                                    written_fighters.append(fighter_url)
+                                    total_fighters_processed += 1
+                                    
+                                    if j % 5 == 0 or j == len(fighter_urls) - 1:  # Progress update every 5 fighters
+                                        self.logger.info("  ✓ Fighter progress: %d/%d - Latest: %s",
+                                                         j + 1, len(fighter_urls), fighter_data.get('name', 'Unknown'))
+                                    
+                                except Exception as e:
+                                    self._add_failed_fighter(fighter_url, e)
+                                    continue
+                        finally:
+                            if fighters_buf:
+                                fighters_fh.write(fighters_buf)
+                                fighters_fh.flush()
+                            for fighter_url in written_fighters:
+                                self._mark_fighter_completed(fighter_url)
+                        
+                        # Only now, with its fighters flushed, is the event done: a run killed
+                        # mid-event (or a fighter loop that raised) redoes the event on restart
+                        self._mark_event_completed(event_url)
+                        total_events_processed += 1
                         
                     except Exception as e:
                         self._add_failed_event(event_url, e)
                         continue
                 
+                for future in ahead.values():
+                    future.cancel()
                 self.logger.info(f"Completed year {year}")
                 
         except KeyboardInterrupt:
@@ -1412,24 +2062,47 @@ class ESPNMMAScraper:
         except Exception as e:
             self.logger.error(f"Unexpected error in crawl_all: {e}")
         finally:
+            if event_pool is not None:
+                event_pool.shutdown(wait=False, cancel_futures=True)
+            events_fh.close()
+            fighters_fh.close()
+            
             # Final progress save
             self._save_progress()
+            self.close()
             
-            self.logger.info("=== CRAWL SUMMARY ===")
-            self.logger.info(f"Total events processed: {total_events_processed}")
-            self.logger.info(f"Total fighters processed: {total_fighters_processed}")
-            self.logger.info(f"Failed events: {len(self.failed_events)}")
-            self.logger.info(f"Failed fighters: {len(self.failed_fighters)}")
-            self.logger.info(f"Completed events: {len(self.completed_events)}")
-            self.logger.info(f"Completed fighters: {len(self.completed_fighters)}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("=== CRAWL SUMMARY ===")
+                self.logger.info(f"Total events processed: {total_events_processed}")
+                self.logger.info(f"Total fighters processed: {total_fighters_processed}")
+                self.logger.info(f"Failed events: {len(self.failed_events)}")
+                self.logger.info(f"Failed fighters: {len(self.failed_fighters)}")
+                self.logger.info(f"Completed events: {len(self.completed_events)}")
+                self.logger.info(f"Completed fighters: {len(self.completed_fighters)}")
     
     def retry_failed_items(self):
         """Retry previously failed events and fighters"""
         self.logger.info("=== RETRYING FAILED ITEMS ===")
         
-        events_path = os.path.join(self.out_dir, "events.jsonl")
-        fighters_path = os.path.join(self.out_dir, "fighters.jsonl")
+        events_path = self._output_path(self.out_dir, "events")
+        fighters_path = self._output_path(self.out_dir, "fighters")
         
+        # Items here already failed a full crawl's attempts: give each page a few more tries
+        saved_max_retries = self.max_retries
+        self.max_retries = max(self.max_retries, self.RETRY_PASS_MAX_RETRIES)
+        try:
+            with self._open_output(events_path) as events_fh, \
+                    self._open_output(fighters_path) as fighters_fh:
+                self._retry_failed_items(events_fh, fighters_fh)
+        finally:
+            self.max_retries = saved_max_retries
+        
+        self._save_progress()
+        self.close()
+        self.logger.info("=== RETRY COMPLETE ===")
+    
+    def _retry_failed_items(self, events_fh, fighters_fh):
+        """Retry loop behind retry_failed_items, writing to the already-open output files"""
         # Retry failed events (with less than 3 attempts)
         events_to_retry = [e for e in self.failed_events if e.get('attempts', 0) < 3]
         self.logger.info(f"Retrying {len(events_to_retry)} failed events")
@@ -1440,12 +2113,13 @@ class ESPNMMAScraper:
                 self.logger.info(f"Retrying event: {event_url}")
                 event_data = self.scrape_event(event_url)
                 if event_data:
-                    with open(events_path, "a", encoding="utf-8") as f:
-                        f.write(json.dumps(event_data, ensure_ascii=False) + "\n")
+                    events_fh.write(_to_jsonl(event_data))
+                    events_fh.flush()
                     
-                    self.completed_events.add(event_url)
-                    # Remove from failed list
-                    self.failed_events = [e for e in self.failed_events if e.get('url') != event_url]
+                    self._mark_event_completed(event_url)
+                    # Remove from failed list (logged, so a killed run doesn't retry it again)
+                    self._resolve_failure("event", event_url)
+                    self._append_progress_log({"resolved_event": event_url})
                     self.logger.info(f"✓ Retry successful: {event_url}")
                 else:
                     raise Exception("No event data returned on retry")
@@ -1462,20 +2136,18 @@ class ESPNMMAScraper:
                 self.logger.info(f"Retrying fighter: {fighter_url}")
                 fighter_data = self.scrape_complete_fighter(fighter_url)
                 if fighter_data:
-                    with open(fighters_path, "a", encoding="utf-8") as f:
-                        f.write(json.dumps(fighter_data, ensure_ascii=False) + "\n")
+                    fighters_fh.write(_to_jsonl(fighter_data))
+                    fighters_fh.flush()
                     
-                    self.completed_fighters.add(fighter_url)
-                    # Remove from failed list
-                    self.failed_fighters = [f for f in self.failed_fighters if f.get('url') != fighter_url]
+                    self._mark_fighter_completed(fighter_url)
+                    # Remove from failed list (logged, so a killed run doesn't retry it again)
+                    self._resolve_failure("fighter", fighter_url)
+                    self._append_progress_log({"resolved_fighter": fighter_url})
                     self.logger.info(f"✓ Retry successful: {fighter_url}")
                 else:
                     raise Exception("No fighter data returned on retry")
             except Exception as e:
                 self._add_failed_fighter(fighter_url, e)
-        
-        self._save_progress()
-        self.logger.info("=== RETRY COMPLETE ===")
 
 
 if __name__ == "__main__":
@@ -1489,6 +2161,11 @@ if __name__ == "__main__":
     parser.add_argument("--use-browser", action="store_true", help="Use browser automation to expand collapsed sections")
     parser.add_argument("--retry-failed", action="store_true", help="Retry previously failed events and fighters")
     parser.add_argument("--leagues", default="ufc", help="Comma-separated leagues to include (default: ufc). Example: ufc,pfl")
+    parser.add_argument("--workers", type=int, default=1, help="Pages to fetch concurrently (default: 1)")
+    parser.add_argument("--debug", action="store_true", help="Print browser-mode page structure diagnostics")
+    parser.add_argument("--http-cache", action="store_true", help="Cache fetched pages on disk for 7 days (needs requests-cache)")
+    parser.add_argument("--max-retries", type=int, default=3, help="Attempts per page fetch (default: 3; --retry-failed uses at least 5)")
+    parser.add_argument("--compress", action="store_true", help="Write events/fighters as .jsonl.zst (needs zstandard; .jsonl.gz otherwise)")
     args = parser.parse_args()
     allowed = [s.strip().lower() for s in args.leagues.split(",") if s.strip()]
 
@@ -1496,7 +2173,12 @@ if __name__ == "__main__":
         delay_range=(args.min_delay, args.max_delay),
         use_browser=args.use_browser,
         out_dir=args.out_dir,
-        allowed_leagues=allowed
+        allowed_leagues=allowed,
+        max_workers=args.workers,
+        debug=args.debug,
+        http_cache=args.http_cache,
+        max_retries=args.max_retries,
+        compress_output=args.compress
     )
     
     if args.retry_failed:
@@ -2,19 +2,92 @@
 """
 Test script for UFC Stats scraper
 Tests all three main functions: fighter, event, and fight scraping
+
+Raw HTML is cached in .html_cache/ next to this file, so re-runs only exercise
+the parsers; delete that directory to fetch fresh pages.
 """
 
 from ufc_stats_scraper import UFCStatsScraper
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import io
 import json
+import os
+import random
+import sys
+import threading
 import time
+import requests
+
+HTML_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".html_cache")
+DELAY_RANGE = (1, 2)
+
+_fetch_session = requests.Session()
+_fetch_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+@lru_cache(maxsize=None)
+def cached_get(url):
+    """Raw page bytes for url: from memory, then the on-disk cache, then the network (with the polite delay)"""
+    path = os.path.join(HTML_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".html")
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    time.sleep(random.uniform(*DELAY_RANGE))
+    response = _fetch_session.get(url, timeout=30)
+    response.raise_for_status()
+    os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+    return response.content
+
+def make_scraper():
+    """UFCStatsScraper whose page fetches go through cached_get (parsing is untouched)"""
+    scraper = UFCStatsScraper(delay_range=DELAY_RANGE)
+    
+    def get(url, **kwargs):
+        response = requests.Response()
+        response._content = cached_get(url)
+        response.status_code = 200
+        response.url = url
+        return response
+    
+    scraper._polite_delay = lambda: None  # cached_get waits only when it really hits the network
+    scraper.session.get = get
+    return scraper
 
-def test_fighter_scraper():
-    """Test fighter data extraction"""
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that keeps each worker thread's prints in its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, s):
+        buf = getattr(self.local, 'buf', None)
+        return (buf or self.stream).write(s)
+    
+    def flush(self):
+        self.stream.flush()
+
+def _run_buffered(out, test):
+    """Run test() on a worker thread, returning its result and everything it printed"""
+    out.local.buf = io.StringIO()
+    try:
+        return test(make_scraper()), out.local.buf.getvalue()
+    finally:
+        out.local.buf = None
+
+def test_fighter_scraper(scraper=None):
+    """Test fighter data extraction. Returns (success, fighter_data) so main() can reuse the data"""
     print("=" * 60)
     print("TESTING FIGHTER SCRAPER")
     print("=" * 60)
     
-    scraper = UFCStatsScraper(delay_range=(1, 2))
+    scraper = scraper or make_scraper()
     fighter_url = "http://ufcstats.com/fighter-details/07225ba28ae309b6"  # Jon Jones
     
     print(f"Scraping: {fighter_url}")
@@ -22,7 +95,7 @@ def test_fighter_scraper():
     
     if not fighter_data:
         print("❌ FAILED: No data returned")
-        return False
+        return False, None
     
     # Test key fields
     required_fields = ['id', 'name', 'nickname', 'height', 'weight', 'wins', 'losses']
@@ -30,7 +103,7 @@ def test_fighter_scraper():
     
     if missing_fields:
         print(f"❌ FAILED: Missing fields: {missing_fields}")
-        return False
+        return False, None
     
     print("✅ SUCCESS: Fighter data extracted")
     print(f"   Name: {fighter_data.get('name', 'N/A')}")
@@ -48,15 +121,15 @@ def test_fighter_scraper():
         recent_fight = fighter_data['fights'][0]  # Most recent fight
         print(f"   Most Recent: vs {recent_fight.get('opponent_name', 'Unknown')} ({recent_fight.get('result', 'N/A')})")
     
-    return True
+    return True, fighter_data
 
-def test_event_scraper():
-    """Test event data extraction"""
+def test_event_scraper(scraper=None):
+    """Test event data extraction. Returns (success, event_data) so main() can reuse the data"""
     print("\n" + "=" * 60)
     print("TESTING EVENT SCRAPER")
     print("=" * 60)
     
-    scraper = UFCStatsScraper(delay_range=(1, 2))
+    scraper = scraper or make_scraper()
     event_url = "http://ufcstats.com/event-details/daff32bc96d1eabf"  # UFC 309
     
     print(f"Scraping: {event_url}")
@@ -64,14 +137,14 @@ def test_event_scraper():
     
     if not event_data:
         print("❌ FAILED: No data returned")
-        return False
+        return False, None
     
     required_fields = ['id', 'name', 'date', 'location']
     missing_fields = [field for field in required_fields if field not in event_data]
     
     if missing_fields:
         print(f"❌ FAILED: Missing fields: {missing_fields}")
-        return False
+        return False, None
     
     print("✅ SUCCESS: Event data extracted")
     print(f"   Name: {event_data.get('name', 'N/A')}")
@@ -79,15 +152,15 @@ def test_event_scraper():
     print(f"   Location: {event_data.get('location', 'N/A')}")
     print(f"   Fights: {len(event_data.get('fights', []))} fights")
     
-    return True
+    return True, event_data
 
-def test_fight_scraper():
-    """Test fight data extraction"""
+def test_fight_scraper(scraper=None):
+    """Test fight data extraction. Returns (success, fight_data) so main() can reuse the data"""
     print("\n" + "=" * 60)
     print("TESTING FIGHT SCRAPER")
     print("=" * 60)
     
-    scraper = UFCStatsScraper(delay_range=(1, 2))
+    scraper = scraper or make_scraper()
     fight_url = "http://ufcstats.com/fight-details/4f4189009a190e35"  # Jones vs Miocic
     
     print(f"Scraping: {fight_url}")
@@ -95,14 +168,14 @@ def test_fight_scraper():
     
     if not fight_data:
         print("❌ FAILED: No data returned")
-        return False
+        return False, None
     
     required_fields = ['id', 'fighters', 'is_title_fight', 'weight_class', 'method', 'round']
     missing_fields = [field for field in required_fields if field not in fight_data]
     
     if missing_fields:
         print(f"❌ FAILED: Missing fields: {missing_fields}")
-        return False
+        return False, None
     
     print("✅ SUCCESS: Fight data extracted")
     print(f"   Event: {fight_data.get('event_name', 'N/A')}")
@@ -135,7 +208,7 @@ def test_fight_scraper():
     for round_data in rounds:
         print(f"     Round {round_data.get('round_number', '?')}: {len(round_data.get('fighters', []))} fighters")
     
-    return True
+    return True, fight_data
 
 def save_sample_data(fighter_data, event_data, fight_data):
     """Save sample data to JSON files for inspection"""
@@ -168,22 +241,30 @@ def main():
     
     start_time = time.time()
     
-    # Run tests
-    fighter_success = test_fighter_scraper()
-    event_success = test_event_scraper() 
-    fight_success = test_fight_scraper()
+    # The three tests are independent, so they run at the same time (each with its own
+    # scraper); their output is printed in order once they are done, and the scraped
+    # data is reused for the samples
+    tests = [test_fighter_scraper, test_event_scraper, test_fight_scraper]
+    out = _ThreadOutput(sys.stdout)
+    sys.stdout = out
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+            futures = [pool.submit(_run_buffered, out, test) for test in tests]
+            results = []
+            for future in futures:
+                result, printed = future.result()
+                out.stream.write(printed)
+                results.append(result)
+    finally:
+        sys.stdout = out.stream
+    (fighter_success, fighter_data), (event_success, event_data), (fight_success, fight_data) = results
     
-    # Get data for saving
+    # Save the data the tests already scraped
     if fighter_success and event_success and fight_success:
         print("\n" + "=" * 60)
-        print("ALL TESTS PASSED - Getting sample data")
+        print("ALL TESTS PASSED - Saving sample data")
         print("=" * 60)
         
-        scraper = UFCStatsScraper(delay_range=(1, 2))
-        fighter_data = scraper.scrape_fighter("http://ufcstats.com/fighter-details/07225ba28ae309b6")
-        event_data = scraper.scrape_event("http://ufcstats.com/event-details/daff32bc96d1eabf")
-        fight_data = scraper.scrape_fight("http://ufcstats.com/fight-details/4f4189009a190e35")
-        
         save_sample_data(fighter_data, event_data, fight_data)
     
     # Summary
@@ -1,6 +1,8 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag, Comment
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
 from urllib.parse import urljoin
@@ -13,75 +15,336 @@ import re
 import random
 import os
 import argparse
+import gzip
+import contextlib
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Optional on-disk HTTP cache, so re-runs don't re-download pages
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional zstd compression for the JSONL outputs (gzip is used without it)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Optional faster JSON encoder for the JSONL outputs
+try:
+    import orjson
+
+    def _to_jsonl(obj) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+except ImportError:
+    def _to_jsonl(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
 
 ALPHABET = "abcdefghijklmnopqrstuvwxyz"
 
+logger = logging.getLogger(__name__)
+
+# Patterns used for every row/page, compiled once
+_RE_DONAV = re.compile(r"doNav\('([^']+)'\)")
+_RE_RECORD = re.compile(r'Record:\s*(\d+)-(\d+)-(\d+)(?:\s*\((\d+)\s*NC\))?')
+_RE_FRACTION = re.compile(r'(\d+)(?:\s+of\s+(\d+))?')
+_RE_PCT = re.compile(r'(\d+)%')
+_RE_TIME = re.compile(r'(\d+):(\d+)')
+_RE_DETAILS = re.compile(r'\bDetails:\s*(.+)', re.I)
+_RE_TITLE_BOUT = re.compile(r'\b(Title|Bout)\b')
+_RE_ROUND = re.compile(r'Round\s+(\d+)')
+# Script/style blocks are never queried; cutting them from the raw bytes keeps them out of the tree
+_RE_UNUSED_BLOCKS = re.compile(rb'<(script|style|noscript)\b.*?</\1\s*>', re.S | re.I)
+
+# "Per round" collapse links; the text sits beside an <i> icon, so find_all(string=...) can't match it
+_PER_ROUND_LINK_SELECTOR = ('section.b-fight-details__section '
+                            'a.b-fight-details__collapse-link_rnd:-soup-contains("Per round")')
+
+# The link crawlers only need these anchors, so only they are built into the tree
+_FIGHTER_LINK_STRAINER = SoupStrainer('a', href=re.compile(r'/fighter-details/'))
+_FIGHT_LINK_STRAINER = SoupStrainer('a', href=re.compile(r'/fight-details/'))
+
+
+@lru_cache(maxsize=8192)
+def _extract_id_from_url(url: str) -> str:
+    """Last path segment of a UFC Stats URL (the same fighter/event URLs recur many times per page)"""
+    return url.split('/')[-1] if url else ""
+
+
+def _parse_percentage(text: str) -> int:
+    """Parse percentage strings"""
+    if not text:
+        return 0
+    text = text.strip()
+    if text in ["---", ""]:
+        return 0
+    # Fast path for the usual "47%"; anything else goes through the regex
+    if text[-1] == '%' and text[:-1].isdecimal():
+        return int(text[:-1])
+    match = _RE_PCT.search(text)
+    return int(match.group(1)) if match else 0
+
+
+def _parse_stat_fraction(text: str) -> Tuple[int, int]:
+    """Parse 'X of Y' format stats"""
+    if not text:
+        return 0, 0
+    text = text.strip()
+    if text == "---":
+        return 0, 0
+    # Fast path for the usual "96 of 119" or just "96"; anything else goes through the regex
+    landed, sep, attempted = text.partition(' of ')
+    if landed.isdecimal() and (not sep or attempted.isdecimal()):
+        return int(landed), int(attempted) if sep else int(landed)
+    match = _RE_FRACTION.search(text)
+    if match:
+        landed = int(match.group(1))
+        attempted = int(match.group(2)) if match.group(2) else landed
+        return landed, attempted
+    return 0, 0
+
+
+def _parse_time_control(text: str) -> int:
+    """Convert time control to seconds (MM:SS format)"""
+    if not text:
+        return 0
+    text = text.strip()
+    if text in ["---", "0:00"]:
+        return 0
+    # Fast path for the usual "4:35"; anything else goes through the regex
+    minutes, sep, seconds = text.partition(':')
+    if sep and minutes.isdecimal() and seconds.isdecimal():
+        return int(minutes) * 60 + int(seconds)
+    match = _RE_TIME.search(text)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2))
+    return 0
+
+
+def _text_after(label_elem, separator: str = "") -> str:
+    """
+    Stripped text of the nodes that follow label_elem inside its parent, i.e. the value of a
+    "<i>Label:</i> value" item. Only the siblings are walked, not the label or the whole item.
+    """
+    parts = []
+    for sib in label_elem.next_siblings:
+        if isinstance(sib, Tag):
+            text = sib.get_text(separator, strip=True)
+        elif isinstance(sib, NavigableString) and not isinstance(sib, Comment):
+            text = sib.strip()
+        else:
+            continue
+        if text:
+            parts.append(text)
+    return separator.join(parts)
+
+
+def _cell_text(node) -> str:
+    """get_text(strip=True), without the subtree walk when the node holds a single string (the usual stat cell)"""
+    text = node.string
+    if type(text) is NavigableString:  # not None, and not a Comment (get_text skips those)
+        return text.strip()
+    return node.get_text(strip=True)
+
+
+def _int_or_zero(text: str) -> int:
+    return int(text) if text.isdigit() else 0
+
+
+def _column_texts(cols) -> List[List[str]]:
+    """Stripped text of each b-fight-details__table-text <p> per column (one entry per fighter)"""
+    return [[_cell_text(p) for p in col.find_all('p', class_='b-fight-details__table-text')]
+            for col in cols]
+
+
+def _float_or_zero(text: str) -> float:
+    return float(text) if text else 0
+
+
+# Fighter page info-box label -> (field, converter); physical stats and career stats share one pass
+_FIGHTER_INFO_FIELDS = {
+    'height:': ('height', str),
+    'weight:': ('weight', str),
+    'reach:': ('reach', lambda v: v.replace('"', '').strip()),
+    'stance:': ('stance', str),
+    'dob:': ('dob', str),
+    'slpm:': ('slpm', _float_or_zero),
+    'str. acc.:': ('str_acc', _parse_percentage),
+    'sapm:': ('sapm', _float_or_zero),
+    'str. def:': ('str_def', _parse_percentage),
+    'td avg.:': ('td_avg', _float_or_zero),
+    'td acc.:': ('td_acc', _parse_percentage),
+    'td def.:': ('td_def', _parse_percentage),
+    'sub. avg.:': ('sub_avg', _float_or_zero),
+}
+
+# Fight page detail label -> (field, converter)
+_FIGHT_DETAIL_FIELDS = {
+    'method:': ('method', str),
+    'round:': ('round', _int_or_zero),
+    'time:': ('time', str),
+    'time format:': ('time_format', str),
+    'referee:': ('referee', str),
+    'details:': ('details', str),
+}
+
+
+def _fraction_column(name: str):
+    """Stat column setter for 'X of Y' cells: stores <name>_landed and <name>_attempted"""
+    landed_key, attempted_key = f"{name}_landed", f"{name}_attempted"
+    def store(stats: Dict, text: str):
+        stats[landed_key], stats[attempted_key] = _parse_stat_fraction(text)
+    return store
+
+
+def _value_column(key: str, parse):
+    """Stat column setter storing parse(text) under key"""
+    def store(stats: Dict, text: str):
+        stats[key] = parse(text)
+    return store
+
+
+def _sig_strike_columns(total_name: str, pct_key: str) -> tuple:
+    # Sig str, Sig str %, Head, Body, Leg, Distance, Clinch, Ground
+    return (_fraction_column(total_name), _value_column(pct_key, _parse_percentage)) + tuple(
+        _fraction_column(name) for name in ('head', 'body', 'leg', 'distance', 'clinch', 'ground'))
+
+
+# Setters for the stat columns after the fighter column, in table order (zip them with _column_texts)
+# General stats: KD, Sig str, Sig str %, Total str, TD, TD %, Sub att, Rev, Ctrl
+_GENERAL_STAT_COLUMNS = (
+    _value_column('kd', _int_or_zero),
+    _fraction_column('sig_str'),
+    _value_column('sig_str_pct', _parse_percentage),
+    _fraction_column('total_str'),
+    _fraction_column('td'),
+    _value_column('td_pct', _parse_percentage),
+    _value_column('sub_att', _int_or_zero),
+    _value_column('rev', _int_or_zero),
+    _value_column('control_time', _parse_time_control),
+)
+_TOTALS_SIG_STRIKE_COLUMNS = _sig_strike_columns('sig_str_total', 'sig_str_pct')
+_ROUND_SIG_STRIKE_COLUMNS = _sig_strike_columns('sig_str_total', 'sig_str_pct_detailed')
+_ROW_SIG_STRIKE_COLUMNS = _sig_strike_columns('sig_str', 'sig_str_pct')
+
 class UFCStatsScraper:
-    def __init__(self, delay_range=(1, 3)):
+    def __init__(self, delay_range=(1, 3), max_workers=1, http_cache=False, cache_path="ufcstats_http_cache.sqlite",
+                 compress_output=False):
         """
         UFC Stats scraper with polite crawling delays
+        max_workers > 1 lets the scrape_*s batch methods fetch that many pages concurrently.
+        http_cache=True keeps successful responses in cache_path for a day (needs requests-cache);
+        cached pages are served without a request or a polite delay.
+        compress_output=True makes crawl_all write .jsonl.zst (or .jsonl.gz without zstandard).
         """
         self.base_url = "http://ufcstats.com"
-        self.session = requests.Session()
+        self.http_cache = http_cache and REQUESTS_CACHE_AVAILABLE
+        if self.http_cache:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            self.session = requests_cache.CachedSession(
+                cache_path,
+                backend='sqlite',
+                expire_after=86400,
+                allowable_codes=(200,),
+            )
+        else:
+            self.session = requests.Session()
+            if http_cache:
+                print("Warning: HTTP cache requested but requests-cache not installed (pip install requests-cache). Caching disabled.")
+        # Everything goes to ufcstats.com: keep a pool of kept-alive connections big enough for
+        # the worker threads, and let urllib3 retry 429/5xx responses with backoff
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
         })
         self.delay_range = delay_range
+        self.max_workers = max(1, int(max_workers or 1))
+        self.compress_output = compress_output
+        
+        # Request pacing shared by all worker threads (see _polite_delay)
+        self._rate_lock = threading.Lock()
+        self._next_slot = 0.0
     
     def _polite_delay(self):
-        """Add random delay between requests"""
-        time.sleep(random.uniform(*self.delay_range))
+        """
+        Add random delay between requests. Requests start at least one delay apart, divided
+        across max_workers (so --workers N allows N requests per delay in total).
+        """
+        if self.max_workers <= 1:
+            time.sleep(random.uniform(*self.delay_range))
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + random.uniform(*self.delay_range) / self.max_workers
+        if slot > now:
+            time.sleep(slot - now)
     
-    def _get_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a page with error handling"""
+    def _get_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a page with error handling (parse_only: build only the matching elements)"""
         try:
-            self._polite_delay()
+            if not self._is_cached(url):
+                self._polite_delay()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            # lxml is much faster than html.parser; a charset declared in the headers
+            # also saves bs4 from sniffing the bytes for an encoding
+            declared = 'charset=' in response.headers.get('Content-Type', '').lower()
+            markup = _RE_UNUSED_BLOCKS.sub(b'', response.content)
+            return BeautifulSoup(markup, 'lxml', from_encoding=response.encoding if declared else None,
+                                 parse_only=parse_only)
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
     
-    def _get_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def _is_cached(self, url: str) -> bool:
+        """True if the HTTP cache already holds this URL (no request, so no polite delay needed)"""
+        if not self.http_cache:
+            return False
+        try:
+            return self.session.cache.contains(url=url)
+        except Exception:
+            return False
+    
+    def _get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """Compatibility wrapper for older helpers that expect _get_soup."""
-        return self._get_page(url)
+        return self._get_page(url, parse_only=parse_only)
+    
+    def _scrape_many(self, scrape, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Run scrape(url) for each URL, up to max_workers at a time. Returns {url: data} in input order."""
+        urls = list(dict.fromkeys(urls))
+        if self.max_workers <= 1 or len(urls) <= 1:
+            return {url: scrape(url) for url in urls}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            return dict(zip(urls, pool.map(scrape, urls)))
     
     def _extract_id_from_url(self, url: str) -> str:
         """Extract ID from UFC stats URLs"""
-        return url.split('/')[-1] if url else ""
+        return _extract_id_from_url(url)
     
     def _parse_stat_fraction(self, text: str) -> Tuple[int, int]:
         """Parse 'X of Y' format stats"""
-        if not text or text.strip() == "---":
-            return 0, 0
-        
-        # Handle formats like "96 of 119" or just "96"
-        match = re.search(r'(\d+)(?:\s+of\s+(\d+))?', text.strip())
-        if match:
-            landed = int(match.group(1))
-            attempted = int(match.group(2)) if match.group(2) else landed
-            return landed, attempted
-        return 0, 0
+        return _parse_stat_fraction(text)
     
     def _parse_percentage(self, text: str) -> int:
         """Parse percentage strings"""
-        if not text or text.strip() in ["---", ""]:
-            return 0
-        match = re.search(r'(\d+)%', text.strip())
-        return int(match.group(1)) if match else 0
+        return _parse_percentage(text)
     
     def _parse_time_control(self, text: str) -> int:
         """Convert time control to seconds (MM:SS format)"""
-        if not text or text.strip() in ["---", "0:00"]:
-            return 0
-        
-        match = re.search(r'(\d+):(\d+)', text.strip())
-        if match:
-            minutes = int(match.group(1))
-            seconds = int(match.group(2))
-            return minutes * 60 + seconds
-        return 0
+        return _parse_time_control(text)
 
     def scrape_fighter(self, fighter_url: str) -> Dict:
         """Scrape fighter details page"""
@@ -106,7 +369,7 @@ class UFCStatsScraper:
             if record_elem:
                 # Parse "Record: 28-1-0 (1 NC)"
                 record_text = record_elem.get_text(strip=True)
-                record_match = re.search(r'Record:\s*(\d+)-(\d+)-(\d+)(?:\s*\((\d+)\s*NC\))?', record_text)
+                record_match = _RE_RECORD.search(record_text)
                 if record_match:
                     fighter_data.update({
                         'wins': int(record_match.group(1)),
@@ -120,7 +383,7 @@ class UFCStatsScraper:
         if nickname_elem:
             fighter_data['nickname'] = nickname_elem.get_text(strip=True)
         
-        # Physical stats from first info box
+        # Physical stats and career statistics (both info boxes in one pass)
         info_items = soup.find_all('li', class_='b-list__box-list-item')
         for item in info_items:
             title_elem = item.find('i', class_='b-list__box-item-title')
@@ -128,64 +391,29 @@ class UFCStatsScraper:
                 continue
                 
             title = title_elem.get_text(strip=True).lower()
-            value = item.get_text(strip=True).replace(title_elem.get_text(strip=True), '').strip()
-            
-            if 'height:' in title:
-                fighter_data['height'] = value
-            elif 'weight:' in title:
-                fighter_data['weight'] = value
-            elif 'reach:' in title:
-                fighter_data['reach'] = value.replace('"', '').strip()
-            elif 'stance:' in title:
-                fighter_data['stance'] = value
-            elif 'dob:' in title:
-                fighter_data['dob'] = value
-        
-        # Career statistics
-        stat_items = soup.find_all('li', class_='b-list__box-list-item')
-        for item in stat_items:
-            title_elem = item.find('i', class_='b-list__box-item-title')
-            if not title_elem:
+            field = _FIGHTER_INFO_FIELDS.get(title)
+            if field is None:
                 continue
-                
-            title = title_elem.get_text(strip=True).lower()
-            value = item.get_text(strip=True).replace(title_elem.get_text(strip=True), '').strip()
+            value = _text_after(title_elem)
             
-            if 'slpm:' in title:
-                fighter_data['slpm'] = float(value) if value else 0
-            elif 'str. acc.:' in title:
-                fighter_data['str_acc'] = self._parse_percentage(value)
-            elif 'sapm:' in title:
-                fighter_data['sapm'] = float(value) if value else 0
-            elif 'str. def:' in title:
-                fighter_data['str_def'] = self._parse_percentage(value)
-            elif 'td avg.:' in title:
-                fighter_data['td_avg'] = float(value) if value else 0
-            elif 'td acc.:' in title:
-                fighter_data['td_acc'] = self._parse_percentage(value)
-            elif 'td def.:' in title:
-                fighter_data['td_def'] = self._parse_percentage(value)
-            elif 'sub. avg.:' in title:
-                fighter_data['sub_avg'] = float(value) if value else 0
+            key, convert = field
+            fighter_data[key] = convert(value)
         
-        # Fight history
-        fight_rows = soup.find_all('tr', class_='b-fight-details__table-row')
+        # Fight history (header rows have no onclick, so they are filtered out in the same pass)
+        fight_rows = soup.find_all('tr', class_='b-fight-details__table-row', onclick=bool)
         fights = []
         
         for row in fight_rows:
-            if not row.get('onclick'):  # Skip header rows
-                continue
-                
             fight_data = {}
             
             # Extract fight URL from onclick
             onclick = row.get('onclick', '')
-            url_match = re.search(r"doNav\('([^']+)'\)", onclick)
+            url_match = _RE_DONAV.search(onclick)
             if url_match:
                 fight_data['fight_url'] = url_match.group(1)
                 fight_data['fight_id'] = self._extract_id_from_url(url_match.group(1))
             
-            cols = row.find_all('td')
+            cols = row.find_all('td', recursive=False)
             if len(cols) >= 10:
                 # W/L result
                 result_elem = cols[0].find('a', class_='b-flag')
@@ -211,17 +439,17 @@ class UFCStatsScraper:
                 stats_cols = cols[2:6]  # KD, Str, Td, Sub columns
                 stat_values = []
                 for col in stats_cols:
-                    texts = col.find_all('p', class_='b-fight-details__table-text')
+                    texts = col.find_all('p', class_='b-fight-details__table-text', limit=2)
                     if len(texts) >= 2:
                         # First p is current fighter, second is opponent
-                        stat_values.append(texts[0].get_text(strip=True))
+                        stat_values.append(_cell_text(texts[0]))
                 
                 if len(stat_values) >= 4:
                     fight_data.update({
-                        'kd': int(stat_values[0]) if stat_values[0].isdigit() else 0,
-                        'str': int(stat_values[1]) if stat_values[1].isdigit() else 0,
-                        'td': int(stat_values[2]) if stat_values[2].isdigit() else 0,
-                        'sub': int(stat_values[3]) if stat_values[3].isdigit() else 0
+                        'kd': _int_or_zero(stat_values[0]),
+                        'str': _int_or_zero(stat_values[1]),
+                        'td': _int_or_zero(stat_values[2]),
+                        'sub': _int_or_zero(stat_values[3])
                     })
                 
                 # Event info
@@ -232,16 +460,16 @@ class UFCStatsScraper:
                     fight_data['event_id'] = self._extract_id_from_url(event_link.get('href', ''))
                 
                 # Date
-                date_text = cols[6].find_all('p', class_='b-fight-details__table-text')
+                date_text = cols[6].find_all('p', class_='b-fight-details__table-text', limit=2)
                 if len(date_text) >= 2:
-                    fight_data['date'] = date_text[1].get_text(strip=True)
+                    fight_data['date'] = _cell_text(date_text[1])
                 
                 # Method
-                method_texts = cols[7].find_all('p', class_='b-fight-details__table-text')
+                method_texts = cols[7].find_all('p', class_='b-fight-details__table-text', limit=2)
                 if method_texts:
-                    fight_data['method'] = method_texts[0].get_text(strip=True)
+                    fight_data['method'] = _cell_text(method_texts[0])
                     if len(method_texts) > 1:
-                        fight_data['details'] = method_texts[1].get_text(strip=True)
+                        fight_data['details'] = _cell_text(method_texts[1])
                 
                 # Round and Time
                 if len(cols) >= 10:
@@ -253,6 +481,10 @@ class UFCStatsScraper:
         fighter_data['fights'] = fights
         return fighter_data
 
+    def scrape_fighters(self, fighter_urls: Iterable[str]) -> Dict[str, Dict]:
+        """Scrape several fighters, up to max_workers at a time. Returns {fighter_url: data}."""
+        return self._scrape_many(self.scrape_fighter, fighter_urls)
+
     def scrape_event(self, event_url: str) -> Dict:
         """Scrape event details page"""
         soup = self._get_page(event_url)
@@ -277,7 +509,7 @@ class UFCStatsScraper:
                 continue
                 
             title = title_elem.get_text(strip=True).lower()
-            value = item.get_text(strip=True).replace(title_elem.get_text(strip=True), '').strip()
+            value = _text_after(title_elem)
             
             if 'date:' in title:
                 event_data['date'] = value
@@ -285,18 +517,16 @@ class UFCStatsScraper:
                 event_data['location'] = value
         
         # Fight list with links
-        fight_rows = soup.find_all('tr', class_='b-fight-details__table-row')
+        # Rows without a (non-empty) onclick are headers; find_all skips them in the same pass
+        fight_rows = soup.find_all('tr', class_='b-fight-details__table-row', onclick=bool)
         fights = []
         
         for row in fight_rows:
-            if not row.get('onclick'):
-                continue
-                
             fight_data = {}
             
             # Extract fight URL from onclick
             onclick = row.get('onclick', '')
-            url_match = re.search(r"doNav\('([^']+)'\)", onclick)
+            url_match = _RE_DONAV.search(onclick)
             if url_match:
                 fight_data['fight_url'] = url_match.group(1)
                 fight_data['fight_id'] = self._extract_id_from_url(url_match.group(1))
@@ -306,6 +536,10 @@ class UFCStatsScraper:
         event_data['fights'] = fights
         return event_data
 
+    def scrape_events(self, event_urls: Iterable[str]) -> Dict[str, Dict]:
+        """Scrape several events, up to max_workers at a time. Returns {event_url: data}."""
+        return self._scrape_many(self.scrape_event, event_urls)
+
     def scrape_fight(self, fight_url: str) -> Dict:
         """Scrape detailed fight statistics"""
         soup = self._get_page(fight_url)
@@ -318,7 +552,8 @@ class UFCStatsScraper:
         }
         
         # Event info
-        event_link = soup.find('h2', class_='b-content__title').find('a') if soup.find('h2', class_='b-content__title') else None
+        title_elem = soup.find('h2', class_='b-content__title')
+        event_link = title_elem.find('a') if title_elem else None
         if event_link:
             fight_data['event_url'] = event_link.get('href')
             fight_data['event_id'] = self._extract_id_from_url(event_link.get('href', ''))
@@ -352,50 +587,13 @@ class UFCStatsScraper:
         
         fight_data['fighters'] = fighters
         
-        # Fight details
-        details = soup.find('div', class_='b-fight-details__content')
-        if details:
-            text_items = details.find_all('i', class_='b-fight-details__text-item')
-            text_items.extend(details.find_all('i', class_='b-fight-details__text-item_first'))
-
-            for item in text_items:
-                label_elem = item.find('i', class_='b-fight-details__label')
-                if not label_elem:
-                    continue
-
-                label = label_elem.get_text(strip=True).lower()
-                value = item.get_text(strip=True).replace(label_elem.get_text(strip=True), '').strip()
-
-                if 'method:' in label:
-                    fight_data['method'] = value
-                elif 'round:' in label:
-                    fight_data['round'] = int(value) if value.isdigit() else 0
-                elif 'time:' in label and 'time format' not in label:
-                    fight_data['time'] = value
-                elif 'time format:' in label:
-                    fight_data['time_format'] = value
-                elif 'referee:' in label:
-                    fight_data['referee'] = value
-                elif 'details:' in label:
-                    # Sometimes "Details:" is a labeled row just like Method/Referee
-                    fight_data['details'] = value
-
-            # Fallback: on many pages "Details:" is a paragraph right after the labels
-            if 'details' not in fight_data:
-                for p in details.find_all('p', class_='b-fight-details__text'):
-                    txt = p.get_text(" ", strip=True)
-                    m = re.search(r'Details:\s*(.+)', txt)
-                    if m:
-                        fight_data['details'] = m.group(1).strip()
-                        break
-
         fight_title = soup.find('i', class_='b-fight-details__fight-title')
         if fight_title:
             title_text = fight_title.get_text(strip=True)
             fight_data['is_title_fight'] = 'Title' in title_text
             
             # Extract weight class (remove "Title" and "Bout" words)
-            weight_class = re.sub(r'\b(Title|Bout)\b', '', title_text).strip()
+            weight_class = _RE_TITLE_BOUT.sub('', title_text).strip()
             fight_data['weight_class'] = weight_class
         
         # Method, Round, Time, etc.
@@ -409,70 +607,91 @@ class UFCStatsScraper:
                 if not label_elem:
                     continue
 
-                label = label_elem.get_text(strip=True).lower()
+                field = _FIGHT_DETAIL_FIELDS.get(label_elem.get_text(strip=True).lower())
+                if field is None:
+                    continue
                 # preserve spaces so multi-word details don’t collapse
-                value = item.get_text(" ", strip=True).replace(label_elem.get_text(strip=True), '').strip()
-
-                if 'method:' in label:
-                    fight_data['method'] = value
-                elif 'round:' in label:
-                    fight_data['round'] = int(value) if value.isdigit() else 0
-                elif 'time:' in label and 'time format' not in label:
-                    fight_data['time'] = value
-                elif 'time format:' in label:
-                    fight_data['time_format'] = value
-                elif 'referee:' in label:
-                    fight_data['referee'] = value
-                elif 'details:' in label:
-                    # only set when non-empty; don't block the fallback with ""
-                    if value:
-                        fight_data['details'] = value
+                value = _text_after(label_elem, " ")
+
+                key, convert = field
+                # only set details when non-empty; don't block the fallback with ""
+                if key == 'details' and not value:
+                    continue
+                fight_data[key] = convert(value)
 
             # Fallback: paragraph form like "Details: Spinning Back Kick Body"
             # Use truthiness, not key existence, so we recover from an empty labeled row
             if not fight_data.get('details'):
                 for p in details.find_all('p', class_='b-fight-details__text'):
                     txt = p.get_text(" ", strip=True)
-                    m = re.search(r'\bDetails:\s*(.+)', txt, flags=re.I)
+                    m = _RE_DETAILS.search(txt)
                     if m:
                         val = m.group(1).strip()
                         if val:
                             fight_data['details'] = val
                             break
         
-        # Extract fight totals and round data
-        fight_data['totals'] = self._extract_fight_stats(soup, is_totals=True)
-        fight_data['rounds'] = self._extract_round_stats(soup)
+        # Extract fight totals and round data (the page's tables are located once for all three)
+        tables = self._index_fight_tables(soup)
+        fight_data['totals'] = self._extract_fight_stats(soup, is_totals=True, tables=tables)
+        fight_data['rounds'] = self._extract_round_stats(soup, tables)
 
-        fight_data['rounds'] = self._extract_sig_strikes_rounds(soup, fight_data['rounds'])
+        fight_data['rounds'] = self._extract_sig_strikes_rounds(soup, fight_data['rounds'], tables)
         
         return fight_data
 
-    def _extract_fight_stats(self, soup: BeautifulSoup, is_totals=True) -> List[Dict]:
-        """Extract fighter statistics from totals table"""
-        fighters_stats = []
-        
-        # Find the totals table - look for the first table after "Totals" section
-        sections = soup.find_all('section', class_='b-fight-details__section')
-        stats_table = None
+    def scrape_fights(self, fight_urls: Iterable[str]) -> Dict[str, Dict]:
+        """Scrape several fights, up to max_workers at a time. Returns {fight_url: data}."""
+        return self._scrape_many(self.scrape_fight, fight_urls)
+
+    def _index_fight_tables(self, soup: BeautifulSoup) -> Dict:
+        """
+        Locate the fight page's tables in one pass over its sections (and at most one pass over
+        its tables as a fallback): 'totals' and 'sig_strikes' tables (or None) and the list of
+        'per_round_sections'. Shared by _extract_fight_stats and the per-round extractors.
+        """
+        index = {'totals': None, 'sig_strikes': None, 'per_round_sections': []}
+        totals_found = sig_found = False
+        for section in soup.find_all('section', class_='b-fight-details__section'):
+            text = section.get_text()
+            # Totals: the first table after the first section mentioning "Totals"
+            if not totals_found and 'Totals' in text:
+                index['totals'] = section.find_next('table')
+                totals_found = True
+            # Significant strikes: the first table after a section mentioning "Significant Strikes"
+            if not sig_found and 'Significant Strikes' in text:
+                index['sig_strikes'] = section.find_next('table')
+                sig_found = index['sig_strikes'] is not None
         
-        for section in sections:
-            # Look for section containing "Totals" text
-            if section.get_text() and 'Totals' in section.get_text():
-                # Find the next table element
-                stats_table = section.find_next('table')
-                break
+        # Per-round sections: one selector pass over the round collapse links, with the text test
+        # done inside the selector (in document order, so a section's links are adjacent;
+        # Tag == compares whole subtrees, hence `is`)
+        per_round_sections = index['per_round_sections']
+        for link in soup.select(_PER_ROUND_LINK_SELECTOR):
+            section = link.find_parent('section', class_='b-fight-details__section')
+            if not per_round_sections or per_round_sections[-1] is not section:
+                per_round_sections.append(section)
         
-        # If we didn't find it via sections, try a more direct approach
-        if not stats_table:
-            # Look for any table with the right structure
-            tables = soup.find_all('table')
-            for table in tables:
+        # If the sections didn't give them, look for tables with the right header columns
+        if not index['totals'] or not index['sig_strikes']:
+            for table in soup.find_all('table'):
                 thead = table.find('thead')
-                if thead and 'Fighter' in thead.get_text() and 'Sig. str.' in thead.get_text():
-                    stats_table = table
-                    break
+                if not thead:
+                    continue
+                header_text = thead.get_text()
+                if not index['totals'] and 'Fighter' in header_text and 'Sig. str.' in header_text:
+                    index['totals'] = table
+                if not index['sig_strikes'] and 'Head' in header_text and 'Body' in header_text and 'Leg' in header_text:
+                    index['sig_strikes'] = table
+        return index
+
+    def _extract_fight_stats(self, soup: BeautifulSoup, is_totals=True, tables: Optional[Dict] = None) -> List[Dict]:
+        """Extract fighter statistics from totals table (tables: a _index_fight_tables result to reuse)"""
+        fighters_stats = []
+        if tables is None:
+            tables = self._index_fight_tables(soup)
         
+        stats_table = tables['totals']
         if not stats_table:
             return []
         
@@ -499,39 +718,19 @@ class UFCStatsScraper:
                 'id': self._extract_id_from_url(link.get('href', ''))
             })
         
+        # Each stat column has one p per fighter (skip the fighter names column)
+        col_texts = _column_texts(cols[1:1 + len(_GENERAL_STAT_COLUMNS)])
+        
         # Extract stats for each fighter
         for i in range(min(2, len(fighter_names))):  # Max 2 fighters
             fighter_stats = fighter_names[i].copy()
-            
-            # Get stats from each column (each column has 2 p tags for 2 fighters)
-            stat_cols = cols[1:]  # Skip fighter names column
-            stat_names = ['kd', 'sig_str', 'sig_str_pct', 'total_str', 'td', 'td_pct', 'sub_att', 'rev', 'ctrl']
-            
-            for j, col in enumerate(stat_cols):
-                if j >= len(stat_names):
-                    break
-                    
-                stat_texts = col.find_all('p', class_='b-fight-details__table-text')
+            for store, stat_texts in zip(_GENERAL_STAT_COLUMNS, col_texts):
                 if len(stat_texts) > i:
-                    stat_value = stat_texts[i].get_text(strip=True)
-                    
-                    if stat_names[j] in ['sig_str', 'total_str', 'td']:
-                        # Parse "X of Y" format
-                        landed, attempted = self._parse_stat_fraction(stat_value)
-                        fighter_stats[f"{stat_names[j]}_landed"] = landed
-                        fighter_stats[f"{stat_names[j]}_attempted"] = attempted
-                    elif stat_names[j] in ['sig_str_pct', 'td_pct']:
-                        fighter_stats[stat_names[j]] = self._parse_percentage(stat_value)
-                    elif stat_names[j] == 'ctrl':
-                        fighter_stats['control_time'] = self._parse_time_control(stat_value)
-                    else:
-                        # Simple integer stats
-                        fighter_stats[stat_names[j]] = int(stat_value) if stat_value.isdigit() else 0
-            
+                    store(fighter_stats, stat_texts[i])
             fighters_stats.append(fighter_stats)
         
         # Add significant strikes breakdown
-        sig_strikes_table = self._find_sig_strikes_table(soup)
+        sig_strikes_table = self._find_sig_strikes_table(soup, tables)
         if sig_strikes_table:
             sig_stats = self._extract_sig_strikes_stats(sig_strikes_table)
             for i, fighter_stat in enumerate(fighters_stats):
@@ -540,27 +739,11 @@ class UFCStatsScraper:
         
         return fighters_stats
 
-    def _find_sig_strikes_table(self, soup: BeautifulSoup):
-        """Find the significant strikes breakdown table"""
-        # Look for table after "Significant Strikes" text or section
-        # First try to find by section text
-        sections = soup.find_all('section', class_='b-fight-details__section')
-        for section in sections:
-            if 'Significant Strikes' in section.get_text():
-                table = section.find_next('table')
-                if table:
-                    return table
-        
-        # If that doesn't work, look for any table with Head/Body/Leg columns
-        tables = soup.find_all('table')
-        for table in tables:
-            thead = table.find('thead')
-            if thead:
-                header_text = thead.get_text()
-                if 'Head' in header_text and 'Body' in header_text and 'Leg' in header_text:
-                    return table
-        
-        return None
+    def _find_sig_strikes_table(self, soup: BeautifulSoup, tables: Optional[Dict] = None):
+        """Find the significant strikes breakdown table (after the "Significant Strikes" section, else by Head/Body/Leg columns)"""
+        if tables is None:
+            tables = self._index_fight_tables(soup)
+        return tables['sig_strikes']
 
     def _extract_sig_strikes_stats(self, table) -> List[Dict]:
         """Extract significant strikes breakdown (Head/Body/Leg, Distance/Clinch/Ground)"""
@@ -580,30 +763,15 @@ class UFCStatsScraper:
         for link in name_links:
             fighter_names.append(link.get_text(strip=True))
         
+        # Columns: Sig str, Sig str %, Head, Body, Leg, Distance, Clinch, Ground
+        col_texts = _column_texts(cols[1:1 + len(_TOTALS_SIG_STRIKE_COLUMNS)])
+        
         # Extract stats for each fighter
         for i in range(min(2, len(fighter_names))):
             fighter_stats = {}
-            
-            # Columns: Sig str, Sig str %, Head, Body, Leg, Distance, Clinch, Ground
-            stat_cols = cols[1:]
-            stat_names = ['sig_str_total', 'sig_str_pct', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']
-            
-            for j, col in enumerate(stat_cols):
-                if j >= len(stat_names):
-                    break
-                    
-                stat_texts = col.find_all('p', class_='b-fight-details__table-text')
+            for store, stat_texts in zip(_TOTALS_SIG_STRIKE_COLUMNS, col_texts):
                 if len(stat_texts) > i:
-                    stat_value = stat_texts[i].get_text(strip=True)
-                    
-                    if stat_names[j] in ['sig_str_total', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']:
-                        # Parse "X of Y" format
-                        landed, attempted = self._parse_stat_fraction(stat_value)
-                        fighter_stats[f"{stat_names[j]}_landed"] = landed
-                        fighter_stats[f"{stat_names[j]}_attempted"] = attempted
-                    elif stat_names[j] == 'sig_str_pct':
-                        fighter_stats[stat_names[j]] = self._parse_percentage(stat_value)
-            
+                    store(fighter_stats, stat_texts[i])
             fighters_stats.append(fighter_stats)
         
         return fighters_stats
@@ -611,10 +779,10 @@ class UFCStatsScraper:
     def _extract_round_stats_from_row(self, round_number: int, data_row) -> Dict:
         """Extract stats for a single round from a tr element"""
         cols = data_row.find_all('td')
-        print(f"DEBUG: Round {round_number} has {len(cols)} columns")
+        logger.debug("Round %s has %s columns", round_number, len(cols))
         
         if len(cols) < 9:
-            print(f"DEBUG: Round {round_number} data row has insufficient columns: {len(cols)}")
+            logger.debug("Round %s data row has insufficient columns: %s", round_number, len(cols))
             return None
         
         round_stats = {
@@ -625,9 +793,13 @@ class UFCStatsScraper:
         # Get fighter names from first column
         fighter_links = cols[0].find_all('a', class_='b-link')
         if len(fighter_links) < 2:
-            print(f"DEBUG: Round {round_number} has insufficient fighter links: {len(fighter_links)}")
+            logger.debug("Round %s has insufficient fighter links: %s", round_number, len(fighter_links))
             return None
         
+        # Both fighters' values for every stat column, read once per row. This appears to be
+        # significant strikes breakdown data (9 columns: Fighter + _ROW_SIG_STRIKE_COLUMNS)
+        col_texts = _column_texts(cols[1:1 + len(_ROW_SIG_STRIKE_COLUMNS)])
+        
         # Extract stats for each fighter
         for i in range(2):  # Always 2 fighters
             fighter_name = fighter_links[i].get_text(strip=True)
@@ -636,29 +808,9 @@ class UFCStatsScraper:
                 'name': fighter_name,
                 'id': self._extract_id_from_url(fighter_links[i].get('href', ''))
             }
-            
-            # This appears to be significant strikes breakdown data (9 columns)
-            # Column mapping: Fighter, Sig str, Sig str %, Head, Body, Leg, Distance, Clinch, Ground
-            stat_names = ['sig_str', 'sig_str_pct', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']
-            
-            # Process each stat column
-            for j, stat_name in enumerate(stat_names):
-                col_index = j + 1  # Skip fighter name column
-                if col_index >= len(cols):
-                    break
-                    
-                col = cols[col_index]
-                stat_texts = col.find_all('p', class_='b-fight-details__table-text')
-                
+            for store, stat_texts in zip(_ROW_SIG_STRIKE_COLUMNS, col_texts):
                 if len(stat_texts) > i:
-                    stat_value = stat_texts[i].get_text(strip=True)
-                    
-                    if stat_name in ['sig_str', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']:
-                        landed, attempted = self._parse_stat_fraction(stat_value)
-                        fighter_stats[f"{stat_name}_landed"] = landed
-                        fighter_stats[f"{stat_name}_attempted"] = attempted
-                    elif stat_name == 'sig_str_pct':
-                        fighter_stats[stat_name] = self._parse_percentage(stat_value)
+                    store(fighter_stats, stat_texts[i])
             
             round_stats['fighters'].append(fighter_stats)
         
@@ -678,6 +830,9 @@ class UFCStatsScraper:
         if len(fighter_links) < 2:
             return None
         
+        # Both fighters' values for every stat column (Fighter + _GENERAL_STAT_COLUMNS), read once per row
+        col_texts = _column_texts(cols[1:1 + len(_GENERAL_STAT_COLUMNS)])
+        
         # Extract stats for each fighter
         for i in range(2):  # Always 2 fighters
             fighter_name = fighter_links[i].get_text(strip=True)
@@ -686,195 +841,70 @@ class UFCStatsScraper:
                 'name': fighter_name,
                 'id': self._extract_id_from_url(fighter_links[i].get('href', ''))
             }
-            
-            # Column mapping for general stats: Fighter, KD, Sig str, Sig str %, Total str, TD, TD %, Sub att, Rev, Ctrl
-            stat_names = ['kd', 'sig_str', 'sig_str_pct', 'total_str', 'td', 'td_pct', 'sub_att', 'rev', 'ctrl']
-            
-            for j, stat_name in enumerate(stat_names):
-                col_index = j + 1  # Skip fighter name column
-                if col_index >= len(cols):
-                    break
-                    
-                col = cols[col_index]
-                stat_texts = col.find_all('p', class_='b-fight-details__table-text')
-                
+            for store, stat_texts in zip(_GENERAL_STAT_COLUMNS, col_texts):
                 if len(stat_texts) > i:
-                    stat_value = stat_texts[i].get_text(strip=True)
-                    
-                    if stat_name in ['sig_str', 'total_str', 'td']:
-                        landed, attempted = self._parse_stat_fraction(stat_value)
-                        fighter_stats[f"{stat_name}_landed"] = landed
-                        fighter_stats[f"{stat_name}_attempted"] = attempted
-                    elif stat_name in ['sig_str_pct', 'td_pct']:
-                        fighter_stats[stat_name] = self._parse_percentage(stat_value)
-                    elif stat_name == 'ctrl':
-                        fighter_stats['control_time'] = self._parse_time_control(stat_value)
-                    else:
-                        fighter_stats[stat_name] = int(stat_value) if stat_value.isdigit() else 0
+                    store(fighter_stats, stat_texts[i])
             
             round_stats['fighters'].append(fighter_stats)
         
         return round_stats
 
-    def _extract_round_stats(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract per-round statistics — robust tbody lookup after each Round header"""
-        rounds = []
-
-        print("DEBUG: Starting round extraction")
-
-        # Find ALL sections with "Per round" collapse links
-        sections = soup.find_all('section', class_='b-fight-details__section')
-        per_round_sections = []
-        for section in sections:
-            collapse_link = section.find('a', class_='b-fight-details__collapse-link_rnd')
-            if collapse_link and 'Per round' in collapse_link.get_text():
-                per_round_sections.append(section)
-
-        print(f"DEBUG: Found {len(per_round_sections)} per-round sections")
-        if not per_round_sections:
-            return rounds
-
-        # Use the first per-round section = general stats
-        per_round_section = per_round_sections[0]
-        print("DEBUG: Using first per-round section (general stats)")
-
-        table = per_round_section.find('table', class_='b-fight-details__table')
-        if not table:
-            print("DEBUG: Could not find per-round table")
-            return rounds
-
-        print("DEBUG: Found per-round table")
-
-        # Verify this is the general stats table (has KD, Sig. Str., etc.)
-        header_row = table.find('thead', class_='b-fight-details__table-head_rnd')
-        if header_row:
-            columns = header_row.find_all('th')
-            column_texts = [col.get_text(strip=True) for col in columns]
-            print(f"DEBUG: Table columns: {column_texts}")
-            if 'KD' not in ' '.join(column_texts):
-                print("DEBUG: This doesn't appear to be the general stats table")
-                return rounds
-
-        # Each "Round N" is a <thead class="b-fight-details__table-row_type_head">
-        round_headers = table.find_all('thead', class_='b-fight-details__table-row_type_head')
-        print(f"DEBUG: Found {len(round_headers)} round headers")
-
-        for header in round_headers:
-            th = header.find('th')
-            if not th:
-                continue
-
-            text = th.get_text()
-            if 'Round' not in text:
-                continue
-
-            m = re.search(r'Round\s+(\d+)', text)
-            if not m:
-                continue
-
-            round_number = int(m.group(1))
-            print(f"DEBUG: Processing Round {round_number}")
-
-            # Robust approach: the round's <tbody> is the NEXT sibling of this header
-            tbody = header.find_next_sibling('tbody')
-
-            # Fallback: if parser quirks, climb to the nearest <thead> then hop to next <tbody>
-            if not tbody:
-                parent_thead = header if header.name == 'thead' else header.find_parent('thead')
-                if parent_thead:
-                    tbody = parent_thead.find_next_sibling('tbody')
-
-            if not tbody:
-                print(f"DEBUG: No tbody sibling found for Round {round_number}")
-                continue
-
-            # Safety: ensure this tbody still belongs to the same table
-            if tbody.find_parent('table') is not table:
-                print(f"DEBUG: Skipping Round {round_number} — tbody not in the same table")
-                continue
-
-            rows = tbody.find_all('tr')
-            print(f"DEBUG: Tbody for Round {round_number} has {len(rows)} rows")
-
-            if not rows:
-                print(f"DEBUG: No data rows for Round {round_number}")
-                continue
-
-            data_row = rows[0]  # One combined row per round
-            cols = data_row.find_all('td')
-            print(f"DEBUG: Round {round_number} first row has {len(cols)} columns")
-
-            # General per-round table usually has >= 10 columns
-            if len(cols) >= 10:
-                print(f"DEBUG: Extracting Round {round_number}")
-                round_stats = self._extract_general_round_stats_from_row(round_number, data_row)
-                if round_stats:
-                    rounds.append(round_stats)
-                    print(f"DEBUG: Successfully extracted Round {round_number}")
-                else:
-                    print(f"DEBUG: Failed to extract stats from Round {round_number}")
-            else:
-                print(f"DEBUG: Row has insufficient columns for Round {round_number}: {len(cols)}")
-
-        print(f"DEBUG: Total rounds extracted: {len(rounds)}")
-        return rounds
-    
-    def _extract_round_stats(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_round_stats(self, soup: BeautifulSoup, tables: Optional[Dict] = None) -> List[Dict]:
         """Extract per-round statistics — resilient to tbody-less layouts (thead -> tr)"""
         rounds: List[Dict] = []
 
-        print("DEBUG: Starting round extraction")
+        logger.debug("Starting round extraction")
 
         # Find ALL sections with "Per round" collapse links
-        sections = soup.find_all('section', class_='b-fight-details__section')
-        per_round_sections = []
-        for section in sections:
-            collapse_link = section.find('a', class_='b-fight-details__collapse-link_rnd')
-            if collapse_link and 'Per round' in collapse_link.get_text():
-                per_round_sections.append(section)
+        if tables is None:
+            tables = self._index_fight_tables(soup)
+        per_round_sections = tables['per_round_sections']
 
-        print(f"DEBUG: Found {len(per_round_sections)} per-round sections")
+        logger.debug("Found %s per-round sections", len(per_round_sections))
         if not per_round_sections:
             return rounds
 
         # Use the first per-round section = general stats ("KD, Sig. str., Total str., Td, ...")
         per_round_section = per_round_sections[0]
-        print("DEBUG: Using first per-round section (general stats)")
+        logger.debug("Using first per-round section (general stats)")
 
         table = per_round_section.find('table', class_='b-fight-details__table')
         if not table:
-            print("DEBUG: Could not find per-round table")
+            logger.debug("Could not find per-round table")
             return rounds
 
-        print("DEBUG: Found per-round table")
+        logger.debug("Found per-round table")
 
         # Verify we’re on the general stats per-round table (not the sig-strikes breakdown one)
         header_row = table.find('thead', class_='b-fight-details__table-head_rnd')
         if header_row:
             columns = header_row.find_all('th')
             column_texts = [col.get_text(strip=True) for col in columns]
-            print(f"DEBUG: Table columns: {column_texts}")
+            logger.debug("Table columns: %s", column_texts)
             if 'KD' not in ' '.join(column_texts):
-                print("DEBUG: This doesn't appear to be the general stats table")
+                logger.debug("This doesn't appear to be the general stats table")
                 return rounds
 
         # "Round N" headers
         round_headers = table.find_all('thead', class_='b-fight-details__table-row_type_head')
-        print(f"DEBUG: Found {len(round_headers)} round headers")
+        logger.debug("Found %s round headers", len(round_headers))
 
         for header in round_headers:
             th = header.find('th')
             if not th:
                 continue
             text = th.get_text(strip=True)
-            m = re.search(r'Round\s+(\d+)', text)
+            m = _RE_ROUND.search(text)
             if not m:
                 continue
 
             round_number = int(m.group(1))
-            print(f"DEBUG: Processing Round {round_number}")
+            logger.debug("Processing Round %s", round_number)
 
-            # Walk through *siblings* only, stopping at the next round header
+            # Walk through *siblings* only, stopping at the next round header. Siblings share the
+            # header's parent, so checking the header is in this table covers all of them
+            if header.find_parent('table') is not table:
+                continue
             data_row = None
             for sib in header.next_siblings:
                 # Skip whitespace/text
@@ -883,67 +913,60 @@ class UFCStatsScraper:
 
                 # Stop if we hit the next round header
                 if sib.name == "thead" and "b-fight-details__table-row_type_head" in (sib.get("class") or []):
-                    print(f"DEBUG: Hit next round header before finding a row for Round {round_number}")
+                    logger.debug("Hit next round header before finding a row for Round %s", round_number)
                     break
 
                 # Case 1: tbody -> take its first tr
                 if sib.name == "tbody":
-                    # Ensure this tbody belongs to the same table
-                    if sib.find_parent('table') is table:
-                        rows = sib.find_all('tr')
-                        print(f"DEBUG: Found tbody with {len(rows)} rows for Round {round_number}")
-                        if rows:
-                            data_row = rows[0]
-                            break
+                    data_row = sib.find('tr')
+                    if data_row is not None:
+                        logger.debug("Found tbody row for Round %s", round_number)
+                        break
 
                 # Case 2: some parsers flatten to thead -> tr (no tbody)
                 if sib.name == "tr":
-                    # Ensure this tr is still in this table (either direct child or inside implicit tbody)
-                    if sib.find_parent('table') is table:
-                        print(f"DEBUG: Found tr directly after header for Round {round_number}")
-                        data_row = sib
-                        break
+                    logger.debug("Found tr directly after header for Round %s", round_number)
+                    data_row = sib
+                    break
 
             if not data_row:
-                print(f"DEBUG: No data row found for Round {round_number}")
+                logger.debug("No data row found for Round %s", round_number)
                 continue
 
             cols = data_row.find_all('td')
-            print(f"DEBUG: Round {round_number} first row has {len(cols)} columns")
+            logger.debug("Round %s first row has %s columns", round_number, len(cols))
 
             # General per-round table has 10 columns (Fighter, KD, Sig/%, Total, Td/Td%, Sub, Rev, Ctrl)
             if len(cols) >= 10:
-                print(f"DEBUG: Extracting Round {round_number}")
+                logger.debug("Extracting Round %s", round_number)
                 round_stats = self._extract_general_round_stats_from_row(round_number, data_row)
                 if round_stats:
                     rounds.append(round_stats)
-                    print(f"DEBUG: Successfully extracted Round {round_number}")
+                    logger.debug("Successfully extracted Round %s", round_number)
                 else:
-                    print(f"DEBUG: Failed to extract stats from Round {round_number}")
+                    logger.debug("Failed to extract stats from Round %s", round_number)
             else:
-                print(f"DEBUG: Row has insufficient columns for Round {round_number}: {len(cols)}")
+                logger.debug("Row has insufficient columns for Round %s: %s", round_number, len(cols))
 
-        print(f"DEBUG: Total rounds extracted: {len(rounds)}")
+        logger.debug("Total rounds extracted: %s", len(rounds))
         return rounds
 
 
-    def _extract_sig_strikes_rounds(self, soup: BeautifulSoup, existing_rounds: List[Dict]) -> List[Dict]:
+    def _extract_sig_strikes_rounds(self, soup: BeautifulSoup, existing_rounds: List[Dict],
+                                    tables: Optional[Dict] = None) -> List[Dict]:
         """Extract Significant Strikes per-round breakdown and merge into existing round data."""
         if not existing_rounds:
             return existing_rounds
 
-        print("DEBUG: Starting significant strikes per-round extraction")
+        logger.debug("Starting significant strikes per-round extraction")
 
         # Find all "Per round" sections on the page
-        sections = soup.find_all('section', class_='b-fight-details__section')
-        per_round_sections = []
-        for section in sections:
-            link = section.find('a', class_='b-fight-details__collapse-link_rnd')
-            if link and 'Per round' in link.get_text():
-                per_round_sections.append(section)
+        if tables is None:
+            tables = self._index_fight_tables(soup)
+        per_round_sections = tables['per_round_sections']
 
         if not per_round_sections:
-            print("DEBUG: No per-round sections found for sig strikes")
+            logger.debug("No per-round sections found for sig strikes")
             return existing_rounds
 
         # Identify the sig-strikes per-round table by its header (has Head/Body/Leg/Distance)
@@ -959,15 +982,18 @@ class UFCStatsScraper:
                 break
 
         if not sig_table:
-            print("DEBUG: Could not locate significant strikes per-round table")
+            logger.debug("Could not locate significant strikes per-round table")
             return existing_rounds
 
         # Gather all "Round N" headers inside this table
         round_headers = sig_table.find_all('thead', class_='b-fight-details__table-row_type_head')
-        print(f"DEBUG: Sig-strikes per-round: found {len(round_headers)} round headers")
+        logger.debug("Sig-strikes per-round: found %s round headers", len(round_headers))
 
         # Helper: walk siblings after a given header until next header; return first row we see
         def _row_after_header(table, header):
+            # the siblings share the header's parent, so one ancestor check covers them all
+            if header.find_parent('table') is not table:
+                return None
             for sib in header.next_siblings:
                 if not hasattr(sib, "name"):
                     continue
@@ -975,12 +1001,12 @@ class UFCStatsScraper:
                 if sib.name == "thead" and "b-fight-details__table-row_type_head" in (sib.get("class") or []):
                     return None
                 # tbody → take its first tr
-                if sib.name == "tbody" and (sib.find_parent('table') is table):
+                if sib.name == "tbody":
                     tr = sib.find('tr')
                     if tr:
                         return tr
                 # parser may flatten to thead → tr (no tbody)
-                if sib.name == "tr" and (sib.find_parent('table') is table):
+                if sib.name == "tr":
                     return sib
             return None
 
@@ -995,25 +1021,15 @@ class UFCStatsScraper:
             fighter_ids = [self._extract_id_from_url(a.get('href', '')) for a in links]
             fighter_names = [a.get_text(strip=True) for a in links]
 
-            # Columns (skip fighter names col)
-            stat_cols = cols[1:]
-            labels = ['sig_str_total', 'sig_str_pct', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']
+            # Columns (skip fighter names col), each column's texts read once for both fighters
+            col_texts = _column_texts(cols[1:1 + len(_ROUND_SIG_STRIKE_COLUMNS)])
 
             out = []
             for i in range(min(2, len(fighter_ids))):
                 d = {'id': fighter_ids[i], 'name': fighter_names[i]}
-                for j, label in enumerate(labels):
-                    col = stat_cols[j]
-                    texts = col.find_all('p', class_='b-fight-details__table-text')
-                    if len(texts) <= i:
-                        continue
-                    val = texts[i].get_text(strip=True)
-                    if label == 'sig_str_pct':
-                        d['sig_str_pct_detailed'] = self._parse_percentage(val)
-                    else:
-                        landed, attempted = self._parse_stat_fraction(val)
-                        d[f"{label}_landed"] = landed
-                        d[f"{label}_attempted"] = attempted
+                for store, texts in zip(_ROUND_SIG_STRIKE_COLUMNS, col_texts):
+                    if len(texts) > i:
+                        store(d, texts[i])
                 out.append(d)
             return out
 
@@ -1024,20 +1040,20 @@ class UFCStatsScraper:
             th = hdr.find('th')
             if not th:
                 continue
-            m = re.search(r'Round\s+(\d+)', th.get_text(strip=True))
+            m = _RE_ROUND.search(th.get_text(strip=True))
             if not m:
                 continue
 
             rnd = int(m.group(1))
             row = _row_after_header(sig_table, hdr)
             if not row:
-                print(f"DEBUG: Sig-strikes: no row found for Round {rnd}")
+                logger.debug("Sig-strikes: no row found for Round %s", rnd)
                 continue
 
             fighters_stats = _parse_sig_row(row)
             if fighters_stats:
                 sig_by_round[rnd] = fighters_stats
-                print(f"DEBUG: Sig-strikes: parsed Round {rnd}")
+                logger.debug("Sig-strikes: parsed Round %s", rnd)
 
         # Merge into existing rounds by round_number + fighter id
         for rnd_obj in existing_rounds:
@@ -1055,7 +1071,7 @@ class UFCStatsScraper:
                             continue
                         f[k] = v
 
-        print("DEBUG: Significant strikes per-round merged")
+        logger.debug("Significant strikes per-round merged")
         return existing_rounds
 
     def _extract_single_round_sig_strikes(self, round_number: int, tbody) -> List[Dict]:
@@ -1073,32 +1089,16 @@ class UFCStatsScraper:
         # Get fighter names
         fighter_links = cols[0].find_all('a', class_='b-link')
         
+        # Column mapping for sig strikes:
+        # 0: Fighter, 1: Sig str, 2: Sig str %, 3: Head, 4: Body, 5: Leg, 6: Distance, 7: Clinch, 8: Ground
+        col_texts = _column_texts(cols[1:1 + len(_ROUND_SIG_STRIKE_COLUMNS)])
+        
         # Extract sig strikes stats for each fighter
         for i in range(min(2, len(fighter_links))):
             sig_stats = {}
-            
-            # Column mapping for sig strikes:
-            # 0: Fighter, 1: Sig str, 2: Sig str %, 3: Head, 4: Body, 5: Leg, 6: Distance, 7: Clinch, 8: Ground
-            stat_names = ['sig_str_total', 'sig_str_pct_detailed', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']
-            
-            for j, stat_name in enumerate(stat_names):
-                col_index = j + 1
-                if col_index >= len(cols):
-                    break
-                    
-                col = cols[col_index]
-                stat_texts = col.find_all('p', class_='b-fight-details__table-text')
-                
+            for store, stat_texts in zip(_ROUND_SIG_STRIKE_COLUMNS, col_texts):
                 if len(stat_texts) > i:
-                    stat_value = stat_texts[i].get_text(strip=True)
-                    
-                    if stat_name in ['sig_str_total', 'head', 'body', 'leg', 'distance', 'clinch', 'ground']:
-                        landed, attempted = self._parse_stat_fraction(stat_value)
-                        sig_stats[f"{stat_name}_landed"] = landed
-                        sig_stats[f"{stat_name}_attempted"] = attempted
-                    elif stat_name == 'sig_str_pct_detailed':
-                        sig_stats['sig_str_pct_detailed'] = self._parse_percentage(stat_value)
-            
+                    store(sig_stats, stat_texts[i])
             fighters_sig_stats.append(sig_stats)
         
         return fighters_sig_stats
@@ -1110,13 +1110,13 @@ class UFCStatsScraper:
         Example: http://ufcstats.com/statistics/fighters?char=a&page=all
         """
         url = f"{self.base_url}/statistics/fighters?char={letter}&page=all"
-        soup = self._get_soup(url)
+        soup = self._get_soup(url, parse_only=_FIGHTER_LINK_STRAINER)
         if not soup:
             return
 
         # Be flexible about table structure: grab any anchors that look like fighter links
         seen = set()
-        for a in soup.select('a[href*="/fighter-details/"]'):
+        for a in soup.find_all('a'):
             href = (a.get("href") or "").strip()
             if href and "/fighter-details/" in href and href not in seen:
                 seen.add(href)
@@ -1134,18 +1134,38 @@ class UFCStatsScraper:
         On a fighter-details page, pull fight-details links from the 'FIGHT HISTORY - PRO' table.
         Your fighter scraper already visits this page, but this method is lightweight and robust.
         """
-        soup = self._get_soup(fighter_url)
+        soup = self._get_soup(fighter_url, parse_only=_FIGHT_LINK_STRAINER)
         if not soup:
             return
         # Any link that looks like a fight-details page
         seen = set()
-        for a in soup.select('a[href*="/fight-details/"]'):
+        for a in soup.find_all('a'):
             href = (a.get("href") or "").strip()
             if href and "/fight-details/" in href and href not in seen:
                 seen.add(href)
                 yield href
 
     # ---------- Orchestrator ----------
+    def _output_path(self, out_dir: str, name: str) -> str:
+        """fighters/fights/events output path, with the compression suffix when compress_output is set"""
+        path = os.path.join(out_dir, name + ".jsonl")
+        if self.compress_output:
+            path += ".zst" if ZSTD_AVAILABLE else ".gz"
+        return path
+
+    def _open_output(self, path: str):
+        """
+        Open a JSONL output for appending. Compressed outputs get a new frame/member per run
+        (zstd and gzip readers both read concatenated streams), and flush() ends a block so
+        everything written so far is readable even if the run is killed.
+        """
+        if path.endswith(".zst"):
+            cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+            return cctx.stream_writer(open(path, "ab"), closefd=True)
+        if path.endswith(".gz"):
+            return gzip.open(path, "ab", compresslevel=6)
+        return open(path, "ab", buffering=1 << 16)
+
     def crawl_all(
         self,
         letters: str = ALPHABET,
@@ -1156,78 +1176,151 @@ class UFCStatsScraper:
     ):
         """
         Crawl all fighters (A–Z), then all their fights, then events for those fights.
-        Saves fighters.jsonl, fights.jsonl, events.jsonl in `out_dir` (append-only, de-duplicated in-memory).
+        Saves fighters.jsonl, fights.jsonl, events.jsonl in `out_dir` (append-only). The IDs already written
+        are kept in `out_dir`/seen.db, so a restarted crawl skips them.
+        With max_workers > 1 each fighter's fights (and then their events) are fetched concurrently,
+        paced by _polite_delay instead of the extra throttle sleep.
         """
         os.makedirs(out_dir, exist_ok=True)
 
-        fighters_path = os.path.join(out_dir, "fighters.jsonl")
-        fights_path   = os.path.join(out_dir, "fights.jsonl")
-        events_path   = os.path.join(out_dir, "events.jsonl")
+        fighters_path = self._output_path(out_dir, "fighters")
+        fights_path   = self._output_path(out_dir, "fights")
+        events_path   = self._output_path(out_dir, "events")
+
+        # Dedupe sets, hydrated from seen.db when resuming; lookups stay in memory and each new ID
+        # is also inserted into seen.db (committed together with the flushed outputs)
+        seen_db = sqlite3.connect(os.path.join(out_dir, "seen.db")) if write_jsonl else None
+
+        def _load_seen(kind: str) -> Set[str]:
+            if seen_db is None:
+                return set()
+            seen_db.execute(f"CREATE TABLE IF NOT EXISTS seen_{kind} (id TEXT PRIMARY KEY)")
+            return {row[0] for row in seen_db.execute(f"SELECT id FROM seen_{kind}")}
 
-        # In-memory dedupe (optionally hydrate from disk if resuming)
-        seen_fighters: Set[str] = set()
-        seen_fights:   Set[str] = set()
-        seen_events:   Set[str] = set()
+        def _mark_seen(kind: str, seen: Set[str], item_id: str):
+            seen.add(item_id)
+            if seen_db is not None:
+                seen_db.execute(f"INSERT OR IGNORE INTO seen_{kind} (id) VALUES (?)", (item_id,))
+
+        seen_fighters = _load_seen("fighters")        # written to fighters.jsonl
+        done_fighters = _load_seen("fighters_done")   # ... and all their fights/events fetched too
+        seen_fights = _load_seen("fights")
+        seen_events = _load_seen("events")
 
         def _sleep():
             lo, hi = throttle_range
             time.sleep(random.uniform(lo, hi))
 
-        # --- Crawl fighters by letter ---
-        for letter, fighter_url in self.iter_all_fighter_urls(letters):
-            # fighter_id = self._extract_id(fighter_url)  # you already have _extract_id(...)
-            fighter_id = self._extract_id_from_url(fighter_url)
-            if fighter_id in seen_fighters:
-                continue
-
-            try:
-                fighter_data = self.scrape_fighter(fighter_url)  # your existing method
-                seen_fighters.add(fighter_id)
-                if write_jsonl and fighter_data:
-                    with open(fighters_path, "a", encoding="utf-8") as f:
-                        f.write(json.dumps(fighter_data, ensure_ascii=False) + "\n")
-                print(f"[fighters] {letter.upper()} :: {fighter_data.get('name','?')} ({fighter_id})")
-            except Exception as e:
-                print(f"[fighters][ERR] {fighter_url} :: {e}")
-            _sleep()
-
-            # --- For each fighter, crawl their fights ---
-            for fight_url in self.iter_fight_urls_for_fighter(fighter_url):
-                # fight_id = self._extract_id(fight_url)
-                fight_id   = self._extract_id_from_url(fight_url)
-                if fight_id in seen_fights:
-                    continue
+        def _guarded(scrape):
+            """scrape(url) -> (data, error), so one failing page doesn't abort a whole batch"""
+            def run(url):
                 try:
-                    fight_data = self.scrape_fight(fight_url)  # your existing method (now with per-rounds fixed)
-                    if fight_data:
-                        seen_fights.add(fight_id)
-                        if write_jsonl:
-                            with open(fights_path, "a", encoding="utf-8") as f:
-                                f.write(json.dumps(fight_data, ensure_ascii=False) + "\n")
-                        print(f"[fights] {fight_id} :: {fight_data.get('event_name','?')}")
+                    return scrape(url), None
+                except Exception as e:
+                    return None, e
+                finally:
+                    if self.max_workers <= 1:
                         _sleep()
+            return run
+
+        # One buffered handle per output for the whole crawl (closed on exit, even on errors)
+        with contextlib.ExitStack() as stack:
+            if seen_db is not None:
+                stack.callback(seen_db.close)
 
-                        # --- Crawl the event for this fight ---
-                        event_url = fight_data.get("event_url")
-                        if event_url:
-                            # event_id = self._extract_id(event_url)
-                            event_id   = self._extract_id_from_url(event_url)
-                            if event_id not in seen_events:
-                                try:
-                                    event_data = self.scrape_event(event_url)  # your existing method
-                                    if event_data:
-                                        seen_events.add(event_id)
-                                        if write_jsonl:
-                                            with open(events_path, "a", encoding="utf-8") as f:
-                                                f.write(json.dumps(event_data, ensure_ascii=False) + "\n")
-                                        print(f"[events] {event_id} :: {event_data.get('name','?')}")
-                                except Exception as ee:
-                                    print(f"[events][ERR] {event_url} :: {ee}")
-                                _sleep()
+            def _open(path):
+                if not write_jsonl:
+                    return None
+                return stack.enter_context(self._open_output(path))
+
+            fighters_fh = _open(fighters_path)
+            fights_fh = _open(fights_path)
+            events_fh = _open(events_path)
+
+            # --- Crawl fighters by letter ---
+            for letter, fighter_url in self.iter_all_fighter_urls(letters):
+                # fighter_id = self._extract_id(fighter_url)  # you already have _extract_id(...)
+                fighter_id = self._extract_id_from_url(fighter_url)
+                if fighter_id in done_fighters:
+                    continue
+
+                # Cleared by any failed page below, so a resumed crawl retries this fighter
+                # (_get_page swallows fetch errors, so an empty result counts as a failure too)
+                complete = True
+                fighter_data = None
+                try:
+                    fighter_data = self.scrape_fighter(fighter_url)  # your existing method
+                    if fighter_data:
+                        # Already written by an earlier, incomplete run: don't write it twice
+                        if fighter_id not in seen_fighters:
+                            _mark_seen("fighters", seen_fighters, fighter_id)
+                            if write_jsonl:
+                                fighters_fh.write(_to_jsonl(fighter_data))
+                        print(f"[fighters] {letter.upper()} :: {fighter_data.get('name','?')} ({fighter_id})")
+                    else:
+                        complete = False
+                        print(f"[fighters][ERR] {fighter_url} :: no data")
                 except Exception as e:
-                    print(f"[fights][ERR] {fight_url} :: {e}")
+                    complete = False
+                    print(f"[fighters][ERR] {fighter_url} :: {e}")
                 _sleep()
 
+                # --- For each fighter, crawl their fights (up to max_workers at a time) ---
+                # The fight history just scraped already has the fight URLs; only re-read the
+                # fighter page for them when it gave none. Known fights are dropped before fetching.
+                fight_urls = [fight['fight_url'] for fight in (fighter_data or {}).get('fights', [])
+                              if fight.get('fight_url')]
+                if not fight_urls:
+                    fight_urls = self.iter_fight_urls_for_fighter(fighter_url)
+                fight_batch: Dict[str, str] = {}
+                for fight_url in fight_urls:
+                    fight_id = self._extract_id_from_url(fight_url)
+                    if fight_id not in seen_fights and fight_id not in fight_batch:
+                        fight_batch[fight_id] = fight_url
+
+                event_batch: Dict[str, str] = {}
+                fight_results = self._scrape_many(_guarded(self.scrape_fight), fight_batch.values())
+                for fight_id, fight_url in fight_batch.items():
+                    fight_data, error = fight_results[fight_url]
+                    if error is not None or not fight_data:
+                        complete = False
+                        print(f"[fights][ERR] {fight_url} :: {error or 'no data'}")
+                        continue
+                    _mark_seen("fights", seen_fights, fight_id)
+                    if write_jsonl:
+                        fights_fh.write(_to_jsonl(fight_data))
+                    print(f"[fights] {fight_id} :: {fight_data.get('event_name','?')}")
+
+                    # --- Then the events for these fights ---
+                    event_url = fight_data.get("event_url")
+                    if event_url:
+                        event_id = self._extract_id_from_url(event_url)
+                        if event_id not in seen_events and event_id not in event_batch:
+                            event_batch[event_id] = event_url
+
+                event_results = self._scrape_many(_guarded(self.scrape_event), event_batch.values())
+                for event_id, event_url in event_batch.items():
+                    event_data, error = event_results[event_url]
+                    if error is not None or not event_data:
+                        complete = False
+                        print(f"[events][ERR] {event_url} :: {error or 'no data'}")
+                        continue
+                    _mark_seen("events", seen_events, event_id)
+                    if write_jsonl:
+                        events_fh.write(_to_jsonl(event_data))
+                    print(f"[events] {event_id} :: {event_data.get('name','?')}")
+
+                # Checkpoint: everything for this fighter is on disk before moving on, and only
+                # then recorded as seen (a crash mid-fighter redoes that fighter on resume); the
+                # fighter itself counts as done only if none of its pages failed
+                if complete:
+                    _mark_seen("fighters_done", done_fighters, fighter_id)
+                for fh in (fighters_fh, fights_fh, events_fh):
+                    if fh:
+                        fh.flush()
+                if seen_db is not None:
+                    seen_db.commit()
+
 # Example usage
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
@@ -1235,7 +1328,18 @@ if __name__ == "__main__":
     ap.add_argument("--out", default="out_q", help="Output directory")
     ap.add_argument("--min-delay", type=float, default=0.6, help="Min polite delay between requests (seconds)")
     ap.add_argument("--max-delay", type=float, default=1.2, help="Max polite delay between requests (seconds)")
+    ap.add_argument("--http-cache", action="store_true", help="Cache fetched pages in <out>/http_cache.sqlite for a day (needs requests-cache)")
+    ap.add_argument("--compress", action="store_true", help="Write .jsonl.zst outputs (needs zstandard; .jsonl.gz otherwise)")
+    ap.add_argument("--workers", type=int, default=1, help="Fight/event pages to fetch concurrently (default: 1)")
+    ap.add_argument("--debug", action="store_true", help="Log round-table parsing details")
     args = ap.parse_args()
-
-    scraper = UFCStatsScraper(delay_range=(args.min_delay, args.max_delay))
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING, format="%(levelname)s %(message)s")
+
+    scraper = UFCStatsScraper(
+        delay_range=(args.min_delay, args.max_delay),
+        max_workers=args.workers,
+        http_cache=args.http_cache,
+        cache_path=os.path.join(args.out, "http_cache.sqlite"),
+        compress_output=args.compress,
+    )
     scraper.crawl_all(letters=args.letters, out_dir=args.out)
\ No newline at end of file